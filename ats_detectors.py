@@ -16,6 +16,7 @@ Implements ATS-specific fetchers for:
 - BambooHR
 """
 
+import asyncio
 import json
 import logging
 import re
@@ -23,6 +24,7 @@ from typing import Dict, List, Optional, Set
 from urllib.parse import urlparse, urljoin
 
 import aiohttp
+import orjson
 from bs4 import BeautifulSoup
 
 logger = logging.getLogger(__name__)
@@ -100,6 +102,24 @@ BANNED_REDIRECTS = {
     "dice.com",
 }
 
+# Hosted job boards whose URL alone names the ATS (e.g. jobs.lever.co/<company>);
+# their jobs come from the ATS API without loading the board page
+ATS_BOARD_HOSTS = {
+    "boards.greenhouse.io": "greenhouse",
+    "jobs.lever.co": "lever",
+    "apply.workable.com": "workable",
+}
+
+# Seconds the ATS fetcher's session caches API host DNS lookups
+ATS_DNS_CACHE_TTL = 300
+
+# Board identifier patterns per ATS (e.g. boards.greenhouse.io/<company>/jobs)
+ATS_IDENTIFIER_RES = {
+    "greenhouse": re.compile(r'boards\.greenhouse\.io/([^/]+)'),
+    "lever": re.compile(r'lever\.co/([^/]+)'),
+    "workable": re.compile(r'workable\.com/([^/]+)'),
+}
+
 
 class ATSDetector:
     """Detects ATS providers from HTML content."""
@@ -149,6 +169,25 @@ class ATSDetector:
 
         return None
 
+    def detect_ats_from_url(self, url: str) -> Optional[str]:
+        """
+        Detect a hosted ATS job board from its URL, without fetching it.
+
+        Args:
+            url: URL of the page
+
+        Returns:
+            ATS provider name for a board URL on ATS_BOARD_HOSTS, or None
+        """
+        try:
+            parsed = urlparse(url)
+        except ValueError:
+            return None
+        # The board's identifier is the first path segment
+        if not parsed.path.strip('/'):
+            return None
+        return ATS_BOARD_HOSTS.get(parsed.netloc.lower())
+
     def is_allowed_ats_redirect(self, url: str) -> bool:
         """Check if URL is an allowed ATS redirect."""
         try:
@@ -177,6 +216,31 @@ class ATSFetcher:
 
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
+        # One HTTP session, and so one connection pool, shared by every ATS
+        # API call. Created on first use, on the event loop that uses it.
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, opening a new one if needed."""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            # All calls go to a handful of fixed API hosts, so their DNS
+            # answers are kept for a few minutes rather than aiohttp's 10 s
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(ttl_dns_cache=ATS_DNS_CACHE_TTL),
+                timeout=aiohttp.ClientTimeout(total=30),
+            )
+            self._session_loop = loop
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session, if one is open."""
+        if self._session is not None:
+            if not self._session.closed and self._session_loop is asyncio.get_running_loop():
+                await self._session.close()
+            self._session = None
+            self._session_loop = None
 
     async def fetch_greenhouse_jobs(self, board_token: str) -> List[Dict]:
         """
@@ -192,25 +256,24 @@ class ATSFetcher:
         try:
             url = f"https://boards-api.greenhouse.io/v1/boards/{board_token}/jobs"
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        jobs_data = data.get('jobs', [])
-                        
-                        for job in jobs_data:
-                            jobs.append({
-                                'title': job.get('title', ''),
-                                'url': job.get('absolute_url', ''),
-                                'summary': job.get('content', '')[:500],
-                                'location': job.get('location', {}).get('name', ''),
-                                'ats': 'greenhouse',
-                                'ats_id': job.get('id'),
-                            })
-                        
-                        self.logger.info("Fetched %d jobs from Greenhouse", len(jobs))
-                    else:
-                        self.logger.warning("Greenhouse API returned %d", response.status)
+            async with self._get_session().get(url) as response:
+                if response.status == 200:
+                    data = await response.json(loads=orjson.loads)
+                    jobs_data = data.get('jobs', [])
+                    
+                    for job in jobs_data:
+                        jobs.append({
+                            'title': job.get('title', ''),
+                            'url': job.get('absolute_url', ''),
+                            'summary': job.get('content', '')[:500],
+                            'location': job.get('location', {}).get('name', ''),
+                            'ats': 'greenhouse',
+                            'ats_id': job.get('id'),
+                        })
+                    
+                    self.logger.info("Fetched %d jobs from Greenhouse", len(jobs))
+                else:
+                    self.logger.warning("Greenhouse API returned %d", response.status)
 
         except Exception as e:
             self.logger.error("Failed to fetch Greenhouse jobs: %s", e)
@@ -231,24 +294,23 @@ class ATSFetcher:
         try:
             url = f"https://api.lever.co/v0/postings/{company_name}"
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
-                    if response.status == 200:
-                        jobs_data = await response.json()
-                        
-                        for job in jobs_data:
-                            jobs.append({
-                                'title': job.get('text', ''),
-                                'url': job.get('hostedUrl', ''),
-                                'summary': job.get('description', '')[:500],
-                                'location': ', '.join([loc.get('name', '') for loc in job.get('categories', {}).get('location', [])]),
-                                'ats': 'lever',
-                                'ats_id': job.get('id'),
-                            })
-                        
-                        self.logger.info("Fetched %d jobs from Lever", len(jobs))
-                    else:
-                        self.logger.warning("Lever API returned %d", response.status)
+            async with self._get_session().get(url) as response:
+                if response.status == 200:
+                    jobs_data = await response.json(loads=orjson.loads)
+                    
+                    for job in jobs_data:
+                        jobs.append({
+                            'title': job.get('text', ''),
+                            'url': job.get('hostedUrl', ''),
+                            'summary': job.get('description', '')[:500],
+                            'location': ', '.join([loc.get('name', '') for loc in job.get('categories', {}).get('location', [])]),
+                            'ats': 'lever',
+                            'ats_id': job.get('id'),
+                        })
+                    
+                    self.logger.info("Fetched %d jobs from Lever", len(jobs))
+                else:
+                    self.logger.warning("Lever API returned %d", response.status)
 
         except Exception as e:
             self.logger.error("Failed to fetch Lever jobs: %s", e)
@@ -269,25 +331,24 @@ class ATSFetcher:
         try:
             url = f"https://apply.workable.com/api/v3/accounts/{company_slug}/jobs"
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        jobs_data = data.get('jobs', [])
-                        
-                        for job in jobs_data:
-                            jobs.append({
-                                'title': job.get('title', ''),
-                                'url': job.get('url', ''),
-                                'summary': job.get('description', '')[:500],
-                                'location': job.get('location', {}).get('city', ''),
-                                'ats': 'workable',
-                                'ats_id': job.get('shortcode'),
-                            })
-                        
-                        self.logger.info("Fetched %d jobs from Workable", len(jobs))
-                    else:
-                        self.logger.warning("Workable API returned %d", response.status)
+            async with self._get_session().get(url) as response:
+                if response.status == 200:
+                    data = await response.json(loads=orjson.loads)
+                    jobs_data = data.get('jobs', [])
+                    
+                    for job in jobs_data:
+                        jobs.append({
+                            'title': job.get('title', ''),
+                            'url': job.get('url', ''),
+                            'summary': job.get('description', '')[:500],
+                            'location': job.get('location', {}).get('city', ''),
+                            'ats': 'workable',
+                            'ats_id': job.get('shortcode'),
+                        })
+                    
+                    self.logger.info("Fetched %d jobs from Workable", len(jobs))
+                else:
+                    self.logger.warning("Workable API returned %d", response.status)
 
         except Exception as e:
             self.logger.error("Failed to fetch Workable jobs: %s", e)
@@ -305,26 +366,14 @@ class ATSFetcher:
         Returns:
             Identifier string or None
         """
+        pattern = ATS_IDENTIFIER_RES.get(ats_type)
+        if pattern is None:
+            return None
+
         try:
-            parsed = urlparse(url)
-            
-            if ats_type == "greenhouse":
-                # Extract board token from URL like boards.greenhouse.io/company/jobs
-                match = re.search(r'boards\.greenhouse\.io/([^/]+)', url)
-                if match:
-                    return match.group(1)
-            
-            elif ats_type == "lever":
-                # Extract company from URL like jobs.lever.co/company
-                match = re.search(r'lever\.co/([^/]+)', url)
-                if match:
-                    return match.group(1)
-            
-            elif ats_type == "workable":
-                # Extract company from URL like apply.workable.com/company
-                match = re.search(r'workable\.com/([^/]+)', url)
-                if match:
-                    return match.group(1)
+            match = pattern.search(url)
+            if match:
+                return match.group(1)
 
         except Exception as e:
             self.logger.debug("Failed to extract ATS identifier: %s", e)
@@ -137,6 +137,26 @@ BLACKLISTED_DOMAINS = {
 }
 
 
+def _url_host(url: str) -> str:
+    """
+    Return the lowercased netloc of a URL.
+
+    Plain http(s) links are split by hand; anything unusual (credentials,
+    backslashes, control characters, other schemes) goes through urlparse.
+    """
+    if url.startswith(("https://", "http://")):
+        rest = url[url.index("://") + 3:]
+        end = len(rest)
+        for delim in "/?#":
+            idx = rest.find(delim, 0, end)
+            if idx != -1:
+                end = idx
+        host = rest[:end]
+        if not any(ch in host for ch in "@\\\t\r\n"):
+            return host.lower()
+    return urlparse(url).netloc.lower()
+
+
 class DomainBlacklist:
     """
     Utility for checking if domains should be blacklisted from crawling.
@@ -168,20 +188,25 @@ class DomainBlacklist:
             True if the domain is blacklisted, False otherwise
         """
         try:
-            parsed = urlparse(url)
-            host = parsed.netloc.lower()
+            host = _url_host(url)
             
             # Remove www. prefix
             if host.startswith('www.'):
                 host = host[4:]
             
-            # Check if host matches any blacklisted domain
-            for blacklisted in self.blacklisted_domains:
-                if host == blacklisted or host.endswith('.' + blacklisted):
+            # Check the host and each parent domain of it against the set,
+            # which is the same as testing host == d or host.endswith('.' + d)
+            # for every blacklisted d, in a few set lookups
+            blacklisted = self.blacklisted_domains
+            suffix = host
+            while True:
+                if suffix in blacklisted:
                     self.logger.debug("Blocked blacklisted domain: %s", url)
                     return True
-            
-            return False
+                dot = suffix.find('.')
+                if dot == -1:
+                    return False
+                suffix = suffix[dot + 1:]
             
         except Exception as e:
             self.logger.debug("Error parsing URL %s: %s", url, e)
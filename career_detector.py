@@ -7,9 +7,10 @@ Detects pages that resemble "careers", "jobs", "opportunities", "join us", etc.
 import logging
 import re
 from typing import Optional
-from urllib.parse import urlparse
+from urllib.parse import urljoin, urlparse
 
 from blacklist import DomainBlacklist
+from normalization import parse_html, text_strings
 
 logger = logging.getLogger(__name__)
 
@@ -108,6 +109,9 @@ ATS_DOMAINS = [
     "breezyhr.com",
 ]
 
+# Page chrome whose links are skipped unless they look career-related
+HEADER_FOOTER_TAGS = frozenset({"header", "nav", "footer"})
+
 
 class CareerPageDetector:
     """Detects whether a page is a career/jobs page."""
@@ -148,17 +152,18 @@ class CareerPageDetector:
             path = parsed.path.lower()
             query = parsed.query.lower()
 
+            combined = f"{path} {query}"
+            has_hint = any(hint in combined for hint in CAREER_PATH_HINTS)
+
             # Check for invalid paths first (from problem statement)
             for invalid_path in INVALID_CAREER_PATHS:
                 if path == invalid_path or path.startswith(invalid_path + "/"):
                     # Only exclude if it doesn't also have career indicators
-                    combined = f"{path} {query}"
-                    if not any(hint in combined for hint in CAREER_PATH_HINTS):
+                    if not has_hint:
                         return False
 
             # Check path and query for career hints
-            combined = f"{path} {query}"
-            return any(hint in combined for hint in CAREER_PATH_HINTS)
+            return has_hint
 
         except Exception as e:
             self.logger.debug("Failed to parse URL %s: %s", url, e)
@@ -186,11 +191,15 @@ class CareerPageDetector:
         # Convert to lowercase for case-insensitive matching
         content_lower = html_content.lower()
 
-        # Count how many career hints are present
-        hint_count = sum(1 for hint in CAREER_CONTENT_HINTS if hint in content_lower)
-
-        # If we find at least 2 career hints, consider it a career page
-        return hint_count >= 2
+        # If we find at least 2 career hints, consider it a career page; stop
+        # scanning the page as soon as the second one turns up
+        hint_count = 0
+        for hint in CAREER_CONTENT_HINTS:
+            if hint in content_lower:
+                hint_count += 1
+                if hint_count >= 2:
+                    return True
+        return False
 
     def get_career_links(self, html_content: str, base_url: str) -> list:
         """
@@ -208,23 +217,22 @@ class CareerPageDetector:
         Returns:
             List of URLs that might be career pages
         """
-        from bs4 import BeautifulSoup
-        from urllib.parse import urljoin
-
         career_links = []
-        soup = BeautifulSoup(html_content, 'lxml')
+        # Only anchors are needed, so read them off the lxml tree rather than
+        # building a BeautifulSoup object for the whole page
+        root = parse_html(html_content)
+        if root is None:
+            return career_links
 
-        # Find header and footer elements for filtering
-        header_elements = soup.find_all(['header', 'nav'])
-        footer_elements = soup.find_all('footer')
-        
         # Track all links and header/footer links separately
         all_links = []
         header_footer_link_count = 0
 
-        for anchor in soup.find_all('a', href=True):
+        for anchor in root.iter('a'):
             href = anchor.get('href')
-            text = anchor.get_text().strip().lower()
+            if href is None:
+                continue
+            text = ''.join(text_strings(anchor)).strip().lower()
             title = anchor.get('title', '').lower()
             
             # Skip javascript and mailto links
@@ -236,20 +244,18 @@ class CareerPageDetector:
             all_links.append(full_url)
             
             # Check if link is in header or footer
-            is_in_header_footer = False
-            for parent in anchor.parents:
-                if parent in header_elements or parent in footer_elements:
-                    is_in_header_footer = True
-                    header_footer_link_count += 1
-                    break
+            is_in_header_footer = next(anchor.iterancestors(*HEADER_FOOTER_TAGS), None) is not None
+            if is_in_header_footer:
+                header_footer_link_count += 1
             
             # Combine text sources
             combined = f"{text} {title}"
+            href_lower = href.lower()
 
             # Check if link text or href suggests careers
             has_career_keyword = (
                 any(hint in combined for hint in CAREER_PATH_HINTS) or
-                any(hint in href.lower() for hint in CAREER_PATH_HINTS) or
+                any(hint in href_lower for hint in CAREER_PATH_HINTS) or
                 any(pattern in combined for pattern in CAREER_LINK_TEXT_PATTERNS)
             )
             
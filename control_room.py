@@ -13,6 +13,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 from enum import Enum
+from itertools import islice
 
 from fastapi import FastAPI, BackgroundTasks, HTTPException
 from fastapi.responses import HTMLResponse, FileResponse, JSONResponse
@@ -48,7 +49,7 @@ class CrawlStatus:
         self.domains_processed: int = 0
         self.jobs_found: int = 0
         self.last_error: Optional[str] = None
-        self.recent_jobs: List[Dict] = []
+        self.recent_jobs: deque = deque(maxlen=50)  # Small in-memory sample of latest jobs
         self.log_buffer: deque = deque(maxlen=500)  # Keep last 500 log lines
         self.paused: bool = False
         self.stop_requested: bool = False
@@ -62,6 +63,7 @@ class CrawlStatus:
         self.paused = False
         self.stop_requested = False
         self.current_run_id = None
+        self.recent_jobs.clear()
     
     def to_dict(self) -> Dict:
         """Convert status to dictionary."""
@@ -138,8 +140,9 @@ async def run_scraper_background(role_filter: Optional[str] = None, remote_only:
         """
         crawl_status.domains_processed = domain_idx
         crawl_status.jobs_found = len(all_jobs)
-        # Keep a small sample in memory for backward compatibility
-        crawl_status.recent_jobs = all_jobs[-50:]  # Keep last 50
+        # Keep a small sample in memory for backward compatibility (the deque
+        # keeps only the last 50, so just append this domain's jobs)
+        crawl_status.recent_jobs.extend(jobs_from_domain)
     
     try:
         # Update state
@@ -206,7 +209,8 @@ async def run_scraper_background(role_filter: Optional[str] = None, remote_only:
             crawl_status.jobs_found = len(jobs)
             # Keep small sample in memory for backward compat, but UI reads from Supabase
             if jobs:
-                crawl_status.recent_jobs = jobs[-50:]
+                crawl_status.recent_jobs.clear()
+                crawl_status.recent_jobs.extend(jobs[-50:])
             crawl_status.state = CrawlerState.COMPLETED
             crawl_status.last_run_finished_at = datetime.utcnow().isoformat() + "Z"
             
@@ -492,10 +496,21 @@ def _get_recent_logs(limit: int) -> dict:
         Dictionary with logs array
     """
     limit = min(limit, 500)
-    recent_logs = list(crawl_status.log_buffer)[-limit:]
+    recent_logs = _deque_tail(crawl_status.log_buffer, limit)
     return {"logs": recent_logs}
 
 
+def _deque_tail(buffer: deque, limit: int) -> List:
+    """Return the last ``limit`` items of a deque without copying the whole buffer."""
+    if limit <= 0:
+        return []
+    if limit >= len(buffer):
+        return list(buffer)
+    tail = list(islice(reversed(buffer), limit))
+    tail.reverse()
+    return tail
+
+
 def _get_recent_jobs() -> dict:
     """
     Helper function to get recent job results from Supabase.
@@ -565,7 +580,7 @@ def _get_recent_jobs() -> dict:
     # Fallback to in-memory jobs if Supabase unavailable
     if crawl_status.recent_jobs:
         return {
-            "jobs": crawl_status.recent_jobs,
+            "jobs": list(crawl_status.recent_jobs),
             "count": len(crawl_status.recent_jobs)
         }
     
@@ -651,27 +666,14 @@ async def get_domains():
     try:
         domains_file = get_domains_file()
         from scraper_engine import load_domains
-        domains = load_domains(domains_file)
+        domain_list = load_domains(domains_file)
         
-        # Format domains for display
-        domain_list = []
-        for domain in domains:
-            if isinstance(domain, dict):
-                domain_list.append({
-                    "website": domain.get("website", ""),
-                    "title": domain.get("title", ""),
-                    "category": domain.get("category", "Unknown"),
-                    "status": "Not scraped",
-                    "last_scraped": None
-                })
-            else:
-                domain_list.append({
-                    "website": domain,
-                    "title": domain,
-                    "category": "Unknown",
-                    "status": "Not scraped",
-                    "last_scraped": None
-                })
+        # load_domains hands back fresh dicts, so add the display fields in
+        # place instead of copying every entry into a new dict
+        for domain in domain_list:
+            domain.setdefault("category", "Unknown")
+            domain["status"] = "Not scraped"
+            domain["last_scraped"] = None
         
         return JSONResponse(content={
             "domains": domain_list,
@@ -27,10 +27,11 @@ class MicrodataExtractor:
     def __init__(self, base_url: str):
         self.base_url = base_url
 
-    def extract(self, html: str) -> List[Dict]:
+    def extract(self, html: str, soup: Optional[BeautifulSoup] = None) -> List[Dict]:
         """Extract jobs from microdata."""
         jobs = []
-        soup = BeautifulSoup(html, 'lxml')
+        if soup is None:
+            soup = BeautifulSoup(html, 'lxml')
 
         # Find elements with itemtype="http://schema.org/JobPosting"
         for item in soup.find_all(attrs={"itemtype": re.compile(r"schema\.org/JobPosting")}):
@@ -83,10 +84,11 @@ class OpenGraphExtractor:
     def __init__(self, base_url: str):
         self.base_url = base_url
 
-    def extract(self, html: str) -> List[Dict]:
+    def extract(self, html: str, soup: Optional[BeautifulSoup] = None) -> List[Dict]:
         """Extract job from OpenGraph tags."""
         jobs = []
-        soup = BeautifulSoup(html, 'lxml')
+        if soup is None:
+            soup = BeautifulSoup(html, 'lxml')
 
         # Look for og:type="job"
         og_type = soup.find('meta', attrs={"property": "og:type", "content": "job"})
@@ -125,10 +127,11 @@ class MetaTagExtractor:
     def __init__(self, base_url: str):
         self.base_url = base_url
 
-    def extract(self, html: str) -> List[Dict]:
+    def extract(self, html: str, soup: Optional[BeautifulSoup] = None) -> List[Dict]:
         """Extract job from meta tags."""
         jobs = []
-        soup = BeautifulSoup(html, 'lxml')
+        if soup is None:
+            soup = BeautifulSoup(html, 'lxml')
 
         # Look for job-specific meta tags
         job_title = self._get_meta(soup, "job_title") or self._get_meta(soup, "jobtitle")
@@ -290,10 +293,11 @@ class CMSPatternExtractor:
     def __init__(self, base_url: str):
         self.base_url = base_url
 
-    def extract(self, html: str) -> List[Dict]:
+    def extract(self, html: str, soup: Optional[BeautifulSoup] = None) -> List[Dict]:
         """Extract jobs based on CMS detection."""
         jobs = []
-        soup = BeautifulSoup(html, 'lxml')
+        if soup is None:
+            soup = BeautifulSoup(html, 'lxml')
 
         # Detect CMS
         cms = self._detect_cms(soup, html)
@@ -8,12 +8,15 @@ Provides:
 - Raw HTML archiving
 """
 
+import gzip
 import json
 import logging
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
-from bs4 import BeautifulSoup
+from urllib.parse import urlsplit
+
+from normalization import parse_html, text_strings
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +48,11 @@ class NoJobsDetector:
         "be the first to know",
     ]
 
+    # Markers of an empty job list: element classes, and strings that make
+    # up a whole text node
+    EMPTY_JOB_CLASSES = frozenset({"no-jobs", "empty-jobs"})
+    EMPTY_JOB_STRINGS = frozenset({"0 jobs", "0 openings"})
+
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
 
@@ -58,8 +66,12 @@ class NoJobsDetector:
         Returns:
             True if no jobs available
         """
-        soup = BeautifulSoup(html, 'lxml')
-        text = soup.get_text().lower()
+        # Only the text and a few attributes are needed, so read them off
+        # the lxml tree rather than building a BeautifulSoup object
+        root = parse_html(html)
+        if root is None:
+            return False
+        text = ''.join(text_strings(root)).lower()
 
         # Check for explicit no-jobs messages
         for pattern in self.NO_JOBS_PATTERNS:
@@ -74,33 +86,55 @@ class NoJobsDetector:
                 return True
 
         # Check if job list is empty but structure exists
-        if self._has_empty_job_structure(soup):
+        if self._has_empty_job_structure(root):
             self.logger.info("Detected empty job structure")
             return True
 
         return False
 
-    def _has_empty_job_structure(self, soup) -> bool:
+    def _has_empty_job_structure(self, root) -> bool:
         """Check if page has job listing structure but no actual jobs."""
-        # Look for common empty list patterns
-        empty_indicators = [
-            soup.find(class_="no-jobs"),
-            soup.find(class_="empty-jobs"),
-            soup.find(id="no-openings"),
-            soup.find(text="0 jobs"),
-            soup.find(text="0 openings"),
-        ]
+        # Look for common empty list patterns. Like BeautifulSoup's text
+        # search, the string markers match any text node, comments included.
+        for node in root.iter():
+            if node.text in self.EMPTY_JOB_STRINGS or node.tail in self.EMPTY_JOB_STRINGS:
+                return True
+            if not isinstance(node.tag, str):
+                continue  # comments and processing instructions
+            classes = node.get('class')
+            if classes and not self.EMPTY_JOB_CLASSES.isdisjoint(classes.split()):
+                return True
+            if node.get('id') == 'no-openings':
+                return True
 
-        return any(indicator is not None for indicator in empty_indicators)
+        return False
 
 
 class ExtractionReporter:
     """Logs extractor failures and generates extraction reports."""
 
+    # gzip level for archived pages (1 is fastest)
+    ARCHIVE_COMPRESSLEVEL = 1
+
     def __init__(self, archive_dir: Optional[Path] = None):
         self.archive_dir = archive_dir
         self.logger = logging.getLogger(self.__class__.__name__)
         self.extraction_reports: List[Dict] = []
+        # Per-extractor totals kept up to date as reports are logged
+        self._by_extractor: Dict[str, Dict[str, int]] = {}
+        self._failure_count = 0
+
+    def _count(self, extractor_name: str, failed: bool):
+        """Update the running totals for one logged report."""
+        counts = self._by_extractor.get(extractor_name)
+        if counts is None:
+            counts = self._by_extractor[extractor_name] = {'total': 0, 'failures': 0, 'successes': 0}
+        counts['total'] += 1
+        if failed:
+            counts['failures'] += 1
+            self._failure_count += 1
+        else:
+            counts['successes'] += 1
 
     def log_extractor_failure(
         self,
@@ -128,6 +162,7 @@ class ExtractionReporter:
         }
 
         self.extraction_reports.append(report)
+        self._count(extractor_name, failed=True)
         
         self.logger.warning(
             "Extractor %s failed on %s: %s (partial results: %d)",
@@ -153,6 +188,7 @@ class ExtractionReporter:
         }
 
         self.extraction_reports.append(report)
+        self._count(extractor_name, failed=False)
         
         self.logger.debug(
             "Extractor %s succeeded on %s: %d results",
@@ -164,20 +200,9 @@ class ExtractionReporter:
     def get_extraction_summary(self) -> Dict:
         """Get summary of all extractions."""
         total = len(self.extraction_reports)
-        failures = sum(1 for r in self.extraction_reports if 'error' in r)
+        failures = self._failure_count
         successes = total - failures
-
-        extractors = {}
-        for report in self.extraction_reports:
-            name = report['extractor']
-            if name not in extractors:
-                extractors[name] = {'total': 0, 'failures': 0, 'successes': 0}
-            
-            extractors[name]['total'] += 1
-            if 'error' in report:
-                extractors[name]['failures'] += 1
-            else:
-                extractors[name]['successes'] += 1
+        extractors = {name: dict(counts) for name, counts in self._by_extractor.items()}
 
         return {
             'total_extractions': total,
@@ -214,11 +239,12 @@ class ExtractionReporter:
             timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
             safe_url = url.replace('/', '_').replace(':', '_')[:100]
             status = 'success' if success else 'failed'
-            filename = f"{timestamp}_{status}_{safe_url}.html"
+            filename = f"{timestamp}_{status}_{safe_url}.html.gz"
 
-            # Save HTML
+            # Save HTML gzip-compressed; markup shrinks several-fold even at
+            # the fastest level
             filepath = self.archive_dir / filename
-            with filepath.open('w', encoding='utf-8') as f:
+            with gzip.open(filepath, 'wt', encoding='utf-8', compresslevel=self.ARCHIVE_COMPRESSLEVEL) as f:
                 f.write(html)
 
             # Save metadata
@@ -303,7 +329,6 @@ class RobotsTxtChecker:
 
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
-        self.cache: Dict[str, bool] = {}
 
     async def can_crawl(self, url: str, user_agent: str = "*") -> bool:
         """
@@ -317,23 +342,15 @@ class RobotsTxtChecker:
             True if crawling is allowed
         """
         # For career pages, we're generally respectful but permissive
-        # This is a simplified implementation
-        
-        from urllib.parse import urlparse
-        parsed = urlparse(url)
-        domain = parsed.netloc
-        
-        # Check cache
-        cache_key = f"{domain}:{parsed.path}"
-        if cache_key in self.cache:
-            return self.cache[cache_key]
+        # This is a simplified implementation. Decisions come from the path
+        # alone, so they are not cached: a per-URL cache never hits (each URL
+        # is crawled once) and would grow with every page visited.
+        path = urlsplit(url).path.lower()
 
         # Allow all career-related paths by default
         career_paths = ['/careers', '/jobs', '/opportunities', '/join']
-        if any(path in parsed.path.lower() for path in career_paths):
-            self.cache[cache_key] = True
+        if any(career_path in path for career_path in career_paths):
             return True
 
         # For other paths, allow by default but could enhance with robots.txt parsing
-        self.cache[cache_key] = True
         return True
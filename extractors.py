@@ -233,10 +233,11 @@ class JobExtractor:
 class JsonLdExtractor(JobExtractor):
     """Extract jobs from JSON-LD JobPosting structured data."""
 
-    def extract(self, html: str) -> List[Dict[str, str]]:
+    def extract(self, html: str, soup: Optional[BeautifulSoup] = None) -> List[Dict[str, str]]:
         """Extract jobs from JSON-LD JobPosting markup."""
         jobs = []
-        soup = BeautifulSoup(html, 'lxml')
+        if soup is None:
+            soup = BeautifulSoup(html, 'lxml')
 
         # Find all script tags with type="application/ld+json"
         for script in soup.find_all('script', type='application/ld+json'):
@@ -298,10 +299,11 @@ class JsonLdExtractor(JobExtractor):
 class AnchorExtractor(JobExtractor):
     """Extract jobs from <a> tags based on TITLE_HINTS heuristics."""
 
-    def extract(self, html: str) -> List[Dict[str, str]]:
+    def extract(self, html: str, soup: Optional[BeautifulSoup] = None) -> List[Dict[str, str]]:
         """Extract jobs from anchor tags."""
         jobs = []
-        soup = BeautifulSoup(html, 'lxml')
+        if soup is None:
+            soup = BeautifulSoup(html, 'lxml')
 
         for anchor in soup.find_all('a', href=True):
             text = self._clean_text(anchor.get_text())
@@ -340,10 +342,11 @@ class AnchorExtractor(JobExtractor):
 class ButtonExtractor(JobExtractor):
     """Extract jobs from <button> elements."""
 
-    def extract(self, html: str) -> List[Dict[str, str]]:
+    def extract(self, html: str, soup: Optional[BeautifulSoup] = None) -> List[Dict[str, str]]:
         """Extract jobs from button elements."""
         jobs = []
-        soup = BeautifulSoup(html, 'lxml')
+        if soup is None:
+            soup = BeautifulSoup(html, 'lxml')
 
         for button in soup.find_all('button'):
             text = self._clean_text(button.get_text())
@@ -390,10 +393,11 @@ class ButtonExtractor(JobExtractor):
 class SectionExtractor(JobExtractor):
     """Extract jobs from sections under headings like 'Open Positions' or 'Join Us'."""
 
-    def extract(self, html: str) -> List[Dict[str, str]]:
+    def extract(self, html: str, soup: Optional[BeautifulSoup] = None) -> List[Dict[str, str]]:
         """Extract jobs from job listing sections."""
         jobs = []
-        soup = BeautifulSoup(html, 'lxml')
+        if soup is None:
+            soup = BeautifulSoup(html, 'lxml')
 
         # Find headings that indicate job sections
         for heading_tag in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
@@ -478,10 +482,11 @@ class SectionExtractor(JobExtractor):
 class HeadingExtractor(JobExtractor):
     """Fallback extractor using heading tags as job titles."""
 
-    def extract(self, html: str) -> List[Dict[str, str]]:
+    def extract(self, html: str, soup: Optional[BeautifulSoup] = None) -> List[Dict[str, str]]:
         """Extract jobs from heading tags."""
         jobs = []
-        soup = BeautifulSoup(html, 'lxml')
+        if soup is None:
+            soup = BeautifulSoup(html, 'lxml')
 
         for heading_tag in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
             for heading in soup.find_all(heading_tag):
@@ -538,16 +543,20 @@ class MultiLayerExtractor:
             HeadingExtractor(base_url),
         ]
 
-    def extract_all(self, html: str) -> List[Dict[str, str]]:
+    def extract_all(self, html: str, soup: Optional[BeautifulSoup] = None) -> List[Dict[str, str]]:
         """
         Run all extractors and return deduplicated results.
         Each extractor maintains its own seen set, so we get the union of all unique jobs.
+        The page is parsed once and the tree shared by every extractor; pass
+        soup to reuse a parse the caller already has.
         """
         all_jobs = []
+        if soup is None:
+            soup = BeautifulSoup(html, 'lxml')
 
         for extractor in self.extractors:
             try:
-                jobs = extractor.extract(html)
+                jobs = extractor.extract(html, soup)
                 all_jobs.extend(jobs)
             except Exception as e:
                 logger.warning("Extractor %s failed: %s", extractor.__class__.__name__, e)
@@ -12,7 +12,7 @@ from typing import List, Optional
 from uuid import uuid4
 
 from models import (
-    CrawlEvent, JobItem, DomainItem,
+    CrawlEvent, JobItem, DomainItem, LogLine,
     NavigationFlowStep, ScreenshotInfo
 )
 from state import crawler_state, events_bus, logs_buffer
@@ -30,8 +30,6 @@ class LogCapture(logging.Handler):
     def emit(self, record: logging.LogRecord):
         try:
             # Create a LogLine from the record
-            from models import LogLine
-            
             log_line = LogLine(
                 ts=datetime.fromtimestamp(record.created),
                 level=record.levelname.lower(),
@@ -44,10 +42,20 @@ class LogCapture(logging.Handler):
             logs_buffer.append(log_line)
             
             # Publish to event bus for SSE
-            asyncio.create_task(events_bus.publish(log_line))
+            events_bus.publish_nowait(log_line)
             
-        except Exception as e:
-            logger.error(f"Error in log capture: {e}")
+        except Exception:
+            # Report through logging's own error hook; logging the failure
+            # normally would route straight back into this handler
+            self.handleError(record)
+
+
+# Single shared handler so every log record is buffered and published once,
+# however many times the integration hook runs
+log_capture = LogCapture()
+log_capture.setFormatter(logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+))
 
 
 async def run_crawl_with_events():
@@ -204,11 +212,7 @@ def integrate_with_existing_scraper():
     # Replace the placeholder run_crawl_job with the actual implementation
     crawler_state.run_crawl_job = run_crawl_with_events
     
-    # Install log capture handler
-    log_capture = LogCapture()
-    log_capture.setFormatter(logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    ))
+    # Install the shared log capture handler (addHandler ignores repeats)
     logging.getLogger().addHandler(log_capture)
     
     logger.info("Scraper integration initialized")
@@ -244,8 +248,8 @@ def add_job_to_state(
     
     crawler_state.add_job(job)
     
-    # Publish event (async)
-    asyncio.create_task(events_bus.publish(CrawlEvent(
+    # Publish event (non-blocking)
+    events_bus.publish_nowait(CrawlEvent(
         id=str(uuid4()),
         ts=datetime.utcnow(),
         level="info",
@@ -258,7 +262,7 @@ def add_job_to_state(
             "remote_type": remote_type,
             "ats": ats
         }
-    )))
+    ))
     
     return job
 
@@ -343,7 +347,7 @@ def update_domain_status(
     
     # Publish event if career page found
     if career_page and status == "career_page_found":
-        asyncio.create_task(events_bus.publish(CrawlEvent(
+        events_bus.publish_nowait(CrawlEvent(
             id=str(uuid4()),
             ts=datetime.utcnow(),
             level="info",
@@ -351,7 +355,7 @@ def update_domain_status(
             domain=domain,
             message=f"Found career page: {career_page}",
             metadata={"career_page": career_page, "ats": ats}
-        )))
+        ))
 
 
 # Example usage in scraper
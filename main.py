@@ -82,7 +82,10 @@ async def run_scraper(domains_file: Optional[str] = None, progress_callback=None
         # Send notifications
         if jobs:
             notifier = JobNotifier()
-            await notifier.send_notifications(jobs)
+            try:
+                await notifier.send_notifications(jobs)
+            finally:
+                await notifier.close()
             logger.info("Notifications sent", extra={"job_count": len(jobs)})
         else:
             logger.info("No jobs found to notify about")
@@ -13,11 +13,79 @@ Provides comprehensive normalization for:
 
 import re
 import logging
-from typing import Dict, Optional, Set
-from bs4 import BeautifulSoup
+from typing import Dict, FrozenSet, List, Optional, Set
+from lxml import etree, html as lxml_html
 
 logger = logging.getLogger(__name__)
 
+# Elements whose content BeautifulSoup's get_text() leaves out
+_NON_TEXT_TAGS = frozenset(("script", "style", "template"))
+
+
+def parse_html(html: str):
+    """
+    Parse an HTML document with lxml.html, or return None if it is empty.
+
+    lxml refuses str input that carries an XML encoding declaration; the
+    text is already decoded, so it is re-parsed as UTF-8 bytes with the
+    encoding pinned (a <meta charset> can't override it).
+    """
+    try:
+        try:
+            return lxml_html.document_fromstring(html)
+        except ValueError:
+            return lxml_html.document_fromstring(
+                html.encode("utf-8", "surrogatepass"),
+                parser=lxml_html.HTMLParser(encoding="utf-8"),
+            )
+    except etree.ParserError:
+        return None
+
+
+def text_strings(element) -> List[str]:
+    """
+    Return the text strings inside an lxml element, in document order.
+
+    These are the strings BeautifulSoup would yield for the same element:
+    every text and tail below it, unstripped, skipping comments and
+    script/style/template bodies but keeping the text after them. The
+    element's own tail is not included.
+    """
+    # Walk with a stack of elements and pending tails rather than recursing,
+    # so deeply nested markup can't hit the recursion limit
+    strings = []
+    stack = [element]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, str):
+            strings.append(node)
+            continue
+        if not isinstance(node.tag, str) or node.tag in _NON_TEXT_TAGS:
+            continue
+        if node.text:
+            strings.append(node.text)
+        for child in reversed(node):
+            if child.tail:
+                stack.append(child.tail)
+            stack.append(child)
+    return strings
+
+
+def html_to_text(html: str) -> str:
+    """
+    Return the visible text of an HTML document, one space between strings.
+
+    Same output as ``BeautifulSoup(html, 'lxml').get_text(separator=' ',
+    strip=True)``, but read straight off the lxml tree instead of building
+    a soup of Python objects first.
+    """
+    root = parse_html(html)
+    if root is None:
+        return ""
+    # BeautifulSoup strips each string separately before joining
+    return ' '.join(filter(None, (text.strip() for text in text_strings(root))))
+
+
 # Title normalization mappings
 TITLE_SYNONYMS = {
     # Engineering titles
@@ -78,6 +146,9 @@ EMPLOYMENT_TYPE_PATTERNS = {
     "contract": re.compile(r'\b(contract|contractor|1099|freelance|temp)\b', re.IGNORECASE),
     "intern": re.compile(r'\b(intern|internship|co-op)\b', re.IGNORECASE),
 }
+# Context characters rechecked along with the text in normalize_employment_type;
+# more than the longest employment-type match plus its word boundary
+EMPLOYMENT_CONTEXT_OVERLAP = 32
 
 # Seniority levels
 SENIORITY_PATTERNS = {
@@ -89,12 +160,21 @@ SENIORITY_PATTERNS = {
     "executive": re.compile(r'\b(c-level|cto|ceo|cmo|coo|cfo)\b', re.IGNORECASE),
 }
 
+# TitleClassifier keyword checks (substring matches on lowercased titles)
+TECHNICAL_TITLE_RE = re.compile("engineer|developer|architect|devops|qa|sre|programmer")
+LEADERSHIP_TITLE_RE = re.compile("director|vp|head of|chief|cto|ceo|lead|principal")
+HUBSPOT_TITLE_RE = re.compile("hubspot|crm|revops|marketing ops")
+
 
 class JobNormalizer:
     """Normalizes job data fields."""
 
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
+        # Employment types found in the last context passed to
+        # normalize_employment_type (every job on a page shares one)
+        self._context: Optional[str] = None
+        self._context_types: FrozenSet[str] = frozenset()
 
     def normalize_title(self, title: str) -> str:
         """
@@ -163,21 +243,46 @@ class JobNormalizer:
             "country": country,
         }
 
-    def normalize_employment_type(self, text: str) -> str:
+    def normalize_employment_type(self, text: str, context: str = "") -> str:
         """
         Detect and normalize employment type.
 
         Args:
             text: Text to analyze
+            context: Optional text that follows ``text``, such as the page
+                     the job was found on. The result is the same as for
+                     ``f"{text} {context}"``, but the context is only scanned
+                     once for repeated calls with the same context.
 
         Returns:
             Employment type (full_time, part_time, contract, intern, unknown)
         """
-        if not text:
+        if not text and not context:
             return "unknown"
 
+        if not context:
+            for emp_type, pattern in EMPLOYMENT_TYPE_PATTERNS.items():
+                if pattern.search(text):
+                    return emp_type
+            return "full_time"  # default assumption
+
+        if context is not self._context:
+            self._context = context
+            self._context_types = frozenset(
+                emp_type for emp_type, pattern in EMPLOYMENT_TYPE_PATTERNS.items()
+                if pattern.search(context)
+            )
+
+        # A match starting in text may run on into the context, at most a
+        # dozen characters. Later matches in the cut-off head of the context
+        # are ignored: the cut can fake a word boundary, and any real match
+        # there is already in the context's own results.
+        head = f"{text} {context[:EMPLOYMENT_CONTEXT_OVERLAP]}"
         for emp_type, pattern in EMPLOYMENT_TYPE_PATTERNS.items():
-            if pattern.search(text):
+            if emp_type in self._context_types:
+                return emp_type
+            match = pattern.search(head)
+            if match and match.start() <= len(text):
                 return emp_type
 
         return "full_time"  # default assumption
@@ -291,8 +396,7 @@ class JobNormalizer:
         """Remove HTML tags from text."""
         if not text:
             return ""
-        soup = BeautifulSoup(text, 'lxml')
-        return soup.get_text(separator=' ', strip=True)
+        return html_to_text(text)
 
 
 class TitleClassifier:
@@ -313,28 +417,26 @@ class TitleClassifier:
             Dict with classification details
         """
         normalized = self.normalizer.normalize_title(title)
-        
+        title_lower = title.lower()
+
         return {
             "original": title,
             "normalized": normalized,
             "department": self.normalizer.classify_department(title),
             "seniority": self.normalizer.normalize_seniority(title),
-            "is_technical": self._is_technical(title),
-            "is_leadership": self._is_leadership(title),
-            "is_hubspot_focused": self._is_hubspot_focused(title),
+            "is_technical": self._is_technical(title_lower),
+            "is_leadership": self._is_leadership(title_lower),
+            "is_hubspot_focused": self._is_hubspot_focused(title_lower),
         }
 
-    def _is_technical(self, title: str) -> bool:
-        """Check if title is technical."""
-        technical_keywords = ["engineer", "developer", "architect", "devops", "qa", "sre", "programmer"]
-        return any(keyword in title.lower() for keyword in technical_keywords)
+    def _is_technical(self, title_lower: str) -> bool:
+        """Check if an already-lowercased title is technical."""
+        return TECHNICAL_TITLE_RE.search(title_lower) is not None
 
-    def _is_leadership(self, title: str) -> bool:
-        """Check if title is leadership."""
-        leadership_keywords = ["director", "vp", "head of", "chief", "cto", "ceo", "lead", "principal"]
-        return any(keyword in title.lower() for keyword in leadership_keywords)
+    def _is_leadership(self, title_lower: str) -> bool:
+        """Check if an already-lowercased title is leadership."""
+        return LEADERSHIP_TITLE_RE.search(title_lower) is not None
 
-    def _is_hubspot_focused(self, title: str) -> bool:
-        """Check if title is HubSpot-focused."""
-        hubspot_keywords = ["hubspot", "crm", "revops", "marketing ops"]
-        return any(keyword in title.lower() for keyword in hubspot_keywords)
+    def _is_hubspot_focused(self, title_lower: str) -> bool:
+        """Check if an already-lowercased title is HubSpot-focused."""
+        return HUBSPOT_TITLE_RE.search(title_lower) is not None
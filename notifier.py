@@ -9,7 +9,7 @@ Handles sending notifications via:
 
 import logging
 import os
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 import aiohttp
 
@@ -27,6 +27,19 @@ class JobNotifier:
 
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
     async def send_notifications(self, jobs: List[Dict]):
         """
@@ -125,16 +138,16 @@ class JobNotifier:
             if SMS_TO:
                 headers["X-Phone"] = SMS_TO
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    NTFY_URL,
-                    data=message.encode("utf-8"),
-                    headers=headers
-                ) as response:
-                    if response.status == 200:
-                        self.logger.info("ntfy notification sent successfully")
-                    else:
-                        self.logger.warning("ntfy notification failed: %d", response.status)
+            session = await self._get_session()
+            async with session.post(
+                NTFY_URL,
+                data=message.encode("utf-8"),
+                headers=headers
+            ) as response:
+                if response.status == 200:
+                    self.logger.info("ntfy notification sent successfully")
+                else:
+                    self.logger.warning("ntfy notification failed: %d", response.status)
 
         except Exception as e:
             self.logger.error("Error sending ntfy notification: %s", e)
@@ -149,15 +162,15 @@ class JobNotifier:
                 "icon_emoji": ":briefcase:",
             }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    SLACK_WEBHOOK,
-                    json=slack_message
-                ) as response:
-                    if response.status == 200:
-                        self.logger.info("Slack notification sent successfully")
-                    else:
-                        self.logger.warning("Slack notification failed: %d", response.status)
+            session = await self._get_session()
+            async with session.post(
+                SLACK_WEBHOOK,
+                json=slack_message
+            ) as response:
+                if response.status == 200:
+                    self.logger.info("Slack notification sent successfully")
+                else:
+                    self.logger.warning("Slack notification failed: %d", response.status)
 
         except Exception as e:
             self.logger.error("Error sending Slack notification: %s", e)
@@ -5,10 +5,11 @@ Classifies jobs as developer, consultant, architect, or senior consultant
 based on content analysis and keyword matching.
 """
 
+import hashlib
 import logging
 import os
-import re
-from typing import Dict, List, Optional, Tuple
+import threading
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -135,12 +136,130 @@ AGENCY_KEYWORDS = [
     "talent agency",
 ]
 
+# Scoring rules: (keywords, points, signal label)
+DEVELOPER_RULES = [
+    (HUBSPOT_TECH_KEYWORDS, 25, "HubSpot mentioned"),
+    (HUBSPOT_STRONG_SIGNALS, 15, "HubSpot strong signals"),
+    (["cms hub"], 25, "CMS Hub"),
+    (["custom module", "custom modules", "theme development", "hubspot theme"], 15, "Theme/modules"),
+    (["hubspot api", "api", "integrations", "private app"], 20, "HubSpot API/Integrations"),
+    (["developer", "engineer", "software engineer"], 10, "Developer title"),
+    (["react", "vue", "angular", "javascript", "typescript"], 5, "Modern JS frameworks"),
+    (["python", "node", "nodejs"], 5, "Backend languages"),
+]
+
+CONSULTANT_RULES = [
+    (HUBSPOT_TECH_KEYWORDS, 25, "HubSpot mentioned"),
+    (HUBSPOT_STRONG_SIGNALS, 15, "HubSpot strong signals"),
+    (["revops", "marketing ops", "mops", "revenue operations"], 20, "RevOps/Marketing Ops"),
+    (["workflows", "automation", "implementation"], 15, "Automation/Implementation"),
+    (["crm migration", "onboarding", "data migration"], 20, "CRM migration/onboarding"),
+    (["consultant", "specialist", "solutions architect"], 10, "Consultant title"),
+    (["sales", "marketing", "service"], 5, "Business functions"),
+]
+
+# Every keyword the classifier looks for, shortest first, each with its own
+# bit. A page is scanned once per distinct keyword to build a hit mask, and
+# the group/rule checks below are then plain mask tests.
+_KEYWORDS: Tuple[str, ...] = tuple(sorted(
+    {
+        keyword
+        for group in (
+            HUBSPOT_TECH_KEYWORDS, HUBSPOT_STRONG_SIGNALS, DEVELOPER_INTENT,
+            CONSULTANT_INTENT, SENIOR_CONSULTANT_INTENT, ARCHITECT_INTENT,
+            REMOTE_KEYWORDS, HYBRID_KEYWORDS, CONTRACT_KEYWORDS, AGENCY_KEYWORDS,
+            *(rule[0] for rule in DEVELOPER_RULES + CONSULTANT_RULES),
+        )
+        for keyword in group
+    },
+    key=lambda k: (len(k), k),
+))
+_KEYWORD_BITS: Dict[str, int] = {k: 1 << i for i, k in enumerate(_KEYWORDS)}
+
+
+def _keyword_mask(keywords: List[str]) -> int:
+    """Combine the bits of a keyword list into one mask."""
+    mask = 0
+    for keyword in keywords:
+        mask |= _KEYWORD_BITS[keyword]
+    return mask
+
+
+# (keyword, bit, mask of the shorter keywords it contains). A keyword can only
+# occur if every keyword inside it does ("hubspot api" needs "hubspot" and
+# "api"), so those misses skip the scan.
+_KEYWORD_SCAN: Tuple[Tuple[str, int, int], ...] = tuple(
+    (k, _KEYWORD_BITS[k], _keyword_mask([j for j in _KEYWORDS[:i] if j in k]))
+    for i, k in enumerate(_KEYWORDS)
+)
+
+# Short tech keywords ("api", "app", "crm") are the likeliest hits, so the
+# gate below tries them first
+_TECH_KEYWORDS_SHORTEST_FIRST = tuple(sorted(HUBSPOT_TECH_KEYWORDS, key=len))
+
+_TECH_MASK = _keyword_mask(HUBSPOT_TECH_KEYWORDS)
+_STRONG_SIGNAL_MASK = _keyword_mask(HUBSPOT_STRONG_SIGNALS)
+_DEVELOPER_INTENT_MASK = _keyword_mask(DEVELOPER_INTENT)
+_CONSULTANT_INTENT_MASK = _keyword_mask(CONSULTANT_INTENT)
+_SENIOR_MASK = _keyword_mask(SENIOR_CONSULTANT_INTENT)
+_ARCHITECT_MASK = _keyword_mask(ARCHITECT_INTENT)
+_REMOTE_MASK = _keyword_mask(REMOTE_KEYWORDS)
+_HYBRID_MASK = _keyword_mask(HYBRID_KEYWORDS)
+_CONTRACT_MASK = _keyword_mask(CONTRACT_KEYWORDS)
+_AGENCY_MASK = _keyword_mask(AGENCY_KEYWORDS)
+
+_DEVELOPER_RULE_MASKS = [(_keyword_mask(k), points, label) for k, points, label in DEVELOPER_RULES]
+_CONSULTANT_RULE_MASKS = [(_keyword_mask(k), points, label) for k, points, label in CONSULTANT_RULES]
+
+
+def _keyword_hits(content: str) -> int:
+    """Return the mask of classifier keywords that occur in lowercased content."""
+    hits = 0
+    for keyword, bit, contained in _KEYWORD_SCAN:
+        if hits & contained == contained and keyword in content:
+            hits |= bit
+    return hits
+
 
 class RoleClassifier:
     """Classifies and scores job roles based on content analysis."""
 
+    # Keyword hit masks of recently classified pages, keyed by a digest of
+    # the text so the pages themselves aren't kept alive
+    HITS_CACHE_SIZE = 64
+
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
+        self._hits_cache: Dict[bytes, int] = {}
+        self._hits_lock = threading.Lock()
+
+        # Filters are read once per classifier. Every scrape run builds a new
+        # JobScraper (and classifier) after the control room has set them.
+        self._allow_agencies = os.getenv("ALLOW_AGENCIES", "false").lower() == "true"
+        self._allowed_roles: Optional[FrozenSet[str]] = frozenset(
+            r.strip() for r in os.getenv("ROLE_FILTER", "").split(",") if r.strip()
+        ) or None
+        self._remote_only = os.getenv("REMOTE_ONLY", "false").lower() == "true"
+
+    def _content_hits(self, content: str) -> int:
+        """Return the keyword hit mask for content, reusing it for text seen recently."""
+        digest = hashlib.blake2b(content.encode("utf-8", "surrogatepass"), digest_size=8).digest()
+        hits = self._hits_cache.get(digest)
+        if hits is None:
+            content_lower = content.lower()
+            # Both roles require a HubSpot tech keyword, so a page without one
+            # can't match anything and skips the full keyword scan
+            if any(k in content_lower for k in _TECH_KEYWORDS_SHORTEST_FIRST):
+                hits = _keyword_hits(content_lower)
+            else:
+                hits = 0
+            # Pages are classified from worker threads, so updates are locked
+            with self._hits_lock:
+                if len(self._hits_cache) >= self.HITS_CACHE_SIZE:
+                    # Evict the oldest entry (dicts keep insertion order)
+                    del self._hits_cache[next(iter(self._hits_cache))]
+                self._hits_cache[digest] = hits
+        return hits
 
     def classify_and_score(self, content: str, job_data: Dict) -> Optional[Dict]:
         """
@@ -153,70 +272,69 @@ class RoleClassifier:
         Returns:
             Dict with role, score, signals, and location info, or None if below threshold
         """
-        content_lower = content.lower()
+        hits = self._content_hits(content)
 
         # Check if it's an agency page (filter out unless explicitly allowed)
-        if self._is_agency_page(content_lower):
+        if self._is_agency_page(hits):
             self.logger.debug("Filtering out agency/staffing page")
             return None
 
-        # Score as developer and consultant
-        developer_score, developer_signals = self._score_developer(content_lower)
-        consultant_score, consultant_signals = self._score_consultant(content_lower)
+        # Score as developer and consultant from the mask alone; signal
+        # labels are only built for the winning role
+        developer_score = self._score_developer(hits)
+        consultant_score = self._score_consultant(hits)
 
         # Detect subtypes
-        is_senior = any(k in content_lower for k in SENIOR_CONSULTANT_INTENT)
-        is_architect = any(k in content_lower for k in ARCHITECT_INTENT)
-        is_remote = any(k in content_lower for k in REMOTE_KEYWORDS)
-        is_hybrid = any(k in content_lower for k in HYBRID_KEYWORDS)
-        is_contract = any(k in content_lower for k in CONTRACT_KEYWORDS)
-
-        # Build candidate roles
-        candidates = []
-        if developer_score >= 60:
-            candidates.append({
-                "role": "developer",
-                "score": developer_score,
-                "signals": developer_signals.copy(),
-            })
-
-        if consultant_score >= 50:
-            candidates.append({
-                "role": "consultant",
-                "score": consultant_score,
-                "signals": consultant_signals.copy(),
-            })
-
-        # Apply boosters and modifiers
-        for candidate in candidates:
-            if is_remote:
-                candidate["score"] += 15
-                candidate["signals"].append("Remote-friendly")
-            if is_hybrid:
-                candidate["score"] += 10
-                candidate["signals"].append("Hybrid work")
-            if is_contract:
-                candidate["score"] += 10
-                candidate["signals"].append("1099/Contract")
-            if is_architect:
-                candidate["score"] += 20
-                candidate["role"] = "architect"
-                candidate["signals"].append("Architect-level")
-            if is_senior and candidate["role"] == "consultant":
-                candidate["score"] += 10
-                candidate["role"] = "senior_consultant"
-                candidate["signals"].append("Senior Consultant Fit")
-
-            # Boost for strong HubSpot signals
-            if any(sig in content_lower for sig in HUBSPOT_STRONG_SIGNALS):
-                candidate["score"] += 10
-                candidate["signals"].append("Strong HubSpot Expertise Signal")
-
-        if not candidates:
+        is_senior = bool(hits & _SENIOR_MASK)
+        is_architect = bool(hits & _ARCHITECT_MASK)
+        is_remote = bool(hits & _REMOTE_MASK)
+        is_hybrid = bool(hits & _HYBRID_MASK)
+        is_contract = bool(hits & _CONTRACT_MASK)
+        has_strong_signal = bool(hits & _STRONG_SIGNAL_MASK)
+
+        is_developer = developer_score >= 60
+        is_consultant = consultant_score >= 50
+        if not is_developer and not is_consultant:
             return None
 
-        # Return the highest scoring role
-        best_match = max(candidates, key=lambda c: c["score"])
+        # Apply boosters and modifiers (shared by both roles)
+        bonus = 0
+        if is_remote:
+            bonus += 15
+        if is_hybrid:
+            bonus += 10
+        if is_contract:
+            bonus += 10
+        if is_architect:
+            bonus += 20
+        # Boost for strong HubSpot signals
+        if has_strong_signal:
+            bonus += 10
+        senior_consultant = is_senior and not is_architect
+        developer_score += bonus
+        consultant_score += bonus + (10 if senior_consultant else 0)
+
+        # Return the highest scoring role (developer wins ties)
+        if is_developer and (not is_consultant or developer_score >= consultant_score):
+            score, signals = developer_score, self._rule_signals(hits, _DEVELOPER_RULE_MASKS)
+            role = "developer"
+        else:
+            score, signals = consultant_score, self._rule_signals(hits, _CONSULTANT_RULE_MASKS)
+            role = "senior_consultant" if senior_consultant else "consultant"
+
+        if is_remote:
+            signals.append("Remote-friendly")
+        if is_hybrid:
+            signals.append("Hybrid work")
+        if is_contract:
+            signals.append("1099/Contract")
+        if is_architect:
+            role = "architect"
+            signals.append("Architect-level")
+        if role == "senior_consultant":
+            signals.append("Senior Consultant Fit")
+        if has_strong_signal:
+            signals.append("Strong HubSpot Expertise Signal")
 
         # Detect location type
         location_type = "onsite"
@@ -226,74 +344,47 @@ class RoleClassifier:
             location_type = "hybrid"
 
         return {
-            "role": best_match["role"],
-            "score": best_match["score"],
-            "signals": best_match["signals"],
+            "role": role,
+            "score": score,
+            "signals": signals,
             "location_type": location_type,
             "is_contract": is_contract,
         }
 
-    def _score_developer(self, content: str) -> Tuple[int, List[str]]:
-        """Score content as a developer role."""
+    def _score_developer(self, hits: int) -> int:
+        """Score a keyword hit mask as a developer role."""
         # Must have both tech keywords and developer intent
-        if not self._has_tech_and_intent(content, DEVELOPER_INTENT):
-            return 0, []
-
-        rules = [
-            (HUBSPOT_TECH_KEYWORDS, 25, "HubSpot mentioned"),
-            (HUBSPOT_STRONG_SIGNALS, 15, "HubSpot strong signals"),
-            (["cms hub"], 25, "CMS Hub"),
-            (["custom module", "custom modules", "theme development", "hubspot theme"], 15, "Theme/modules"),
-            (["hubspot api", "api", "integrations", "private app"], 20, "HubSpot API/Integrations"),
-            (["developer", "engineer", "software engineer"], 10, "Developer title"),
-            (["react", "vue", "angular", "javascript", "typescript"], 5, "Modern JS frameworks"),
-            (["python", "node", "nodejs"], 5, "Backend languages"),
-        ]
-
-        return self._apply_scoring_rules(content, rules)
-
-    def _score_consultant(self, content: str) -> Tuple[int, List[str]]:
-        """Score content as a consultant role."""
+        if not self._has_tech_and_intent(hits, _DEVELOPER_INTENT_MASK):
+            return 0
+
+        return self._apply_scoring_rules(hits, _DEVELOPER_RULE_MASKS)
+
+    def _score_consultant(self, hits: int) -> int:
+        """Score a keyword hit mask as a consultant role."""
         # Must have both tech keywords and consultant intent
-        if not self._has_tech_and_intent(content, CONSULTANT_INTENT):
-            return 0, []
-
-        rules = [
-            (HUBSPOT_TECH_KEYWORDS, 25, "HubSpot mentioned"),
-            (HUBSPOT_STRONG_SIGNALS, 15, "HubSpot strong signals"),
-            (["revops", "marketing ops", "mops", "revenue operations"], 20, "RevOps/Marketing Ops"),
-            (["workflows", "automation", "implementation"], 15, "Automation/Implementation"),
-            (["crm migration", "onboarding", "data migration"], 20, "CRM migration/onboarding"),
-            (["consultant", "specialist", "solutions architect"], 10, "Consultant title"),
-            (["sales", "marketing", "service"], 5, "Business functions"),
-        ]
-
-        return self._apply_scoring_rules(content, rules)
-
-    def _has_tech_and_intent(self, content: str, intent_keywords: List[str]) -> bool:
-        """Check if content has both HubSpot tech keywords and role intent."""
-        has_tech = any(k in content for k in HUBSPOT_TECH_KEYWORDS)
-        has_intent = any(k in content for k in intent_keywords)
-        return has_tech and has_intent
-
-    def _apply_scoring_rules(self, content: str, rules: List[Tuple]) -> Tuple[int, List[str]]:
-        """Apply scoring rules and return score + signals."""
-        score = 0
-        signals = []
-
-        for keywords, points, label in rules:
-            if any(kw in content for kw in keywords):
-                score += points
-                signals.append(label)
-
-        return score, signals
-
-    def _is_agency_page(self, content: str) -> bool:
+        if not self._has_tech_and_intent(hits, _CONSULTANT_INTENT_MASK):
+            return 0
+
+        return self._apply_scoring_rules(hits, _CONSULTANT_RULE_MASKS)
+
+    def _has_tech_and_intent(self, hits: int, intent_mask: int) -> bool:
+        """Check if the hits include both HubSpot tech keywords and role intent."""
+        return bool(hits & _TECH_MASK) and bool(hits & intent_mask)
+
+    def _apply_scoring_rules(self, hits: int, rules: List[Tuple]) -> int:
+        """Apply (mask, points, label) scoring rules and return the score."""
+        return sum(points for mask, points, _ in rules if hits & mask)
+
+    def _rule_signals(self, hits: int, rules: List[Tuple]) -> List[str]:
+        """Return the labels of the (mask, points, label) rules the hits match."""
+        return [label for mask, _, label in rules if hits & mask]
+
+    def _is_agency_page(self, hits: int) -> bool:
         """Check if this is an agency/staffing page (to filter out)."""
-        if os.getenv("ALLOW_AGENCIES", "false").lower() == "true":
+        if self._allow_agencies:
             return False
 
-        return any(keyword in content for keyword in AGENCY_KEYWORDS)
+        return bool(hits & _AGENCY_MASK)
 
     def should_include_role(self, role: str, location_type: str) -> bool:
         """
@@ -307,16 +398,12 @@ class RoleClassifier:
             True if the role passes filters
         """
         # Role filter
-        role_filter = os.getenv("ROLE_FILTER", "")
-        if role_filter:
-            allowed_roles = {r.strip() for r in role_filter.split(",") if r.strip()}
-            if role not in allowed_roles:
-                self.logger.debug("Role %s filtered out by ROLE_FILTER", role)
-                return False
+        if self._allowed_roles is not None and role not in self._allowed_roles:
+            self.logger.debug("Role %s filtered out by ROLE_FILTER", role)
+            return False
 
         # Remote-only filter
-        remote_only = os.getenv("REMOTE_ONLY", "false").lower() == "true"
-        if remote_only and location_type != "remote":
+        if self._remote_only and location_type != "remote":
             self.logger.debug("Non-remote role filtered out by REMOTE_ONLY")
             return False
 
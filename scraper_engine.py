@@ -2,22 +2,28 @@
 Main Playwright-based scraper engine for HubSpot domain-level job scraper.
 
 Uses Playwright for browser automation and BeautifulSoup for HTML parsing.
-Implements custom recursion logic for crawling company domains.
+Implements breadth-first crawling of company domains.
 """
 
 import asyncio
 import hashlib
+import heapq
 import json
 import logging
+import multiprocessing
 import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin, urlparse, urlsplit
 
+import orjson
+from bs4 import BeautifulSoup
 from playwright.async_api import async_playwright, Browser, Page, TimeoutError as PlaywrightTimeout
 
-from bs4 import BeautifulSoup
 from career_detector import CareerPageDetector
 from extractors import MultiLayerExtractor
 from role_classifier import RoleClassifier
@@ -37,7 +43,7 @@ from extraction_utils import (
     RateLimiter,
     RobotsTxtChecker,
 )
-from blacklist import DomainBlacklist
+from blacklist import BLACKLISTED_DOMAINS, DomainBlacklist
 from logging_config import get_logger
 from supabase_persistence import save_jobs_for_domain, create_scrape_run, update_scrape_run, get_or_create_company
 from supabase_client import get_supabase_client
@@ -45,28 +51,15 @@ from supabase_client import get_supabase_client
 logger = get_logger(__name__)
 
 # Legacy SKIP_DOMAINS - kept for backwards compatibility
-# The comprehensive blacklist is now in blacklist.py
-SKIP_DOMAINS = {
-    "instagram.com",
-    "facebook.com",
-    "fb.com",
-    "messenger.com",
-    "linkedin.com",
-    "twitter.com",
-    "x.com",
-    "yelp.com",
-    "youtube.com",
-    "wix.com",
-    "wixstatic.com",
-    "godaddy.com",
-    "about:blank",
-}
+# The comprehensive blacklist in blacklist.py absorbed every entry
+SKIP_DOMAINS = BLACKLISTED_DOMAINS
 
 # Configuration (from problem statement requirements)
 MAX_PAGES_PER_DOMAIN = int(os.getenv("MAX_PAGES_PER_DOMAIN", "12"))  # Set to 12 per requirements
 PAGE_TIMEOUT = int(os.getenv("PAGE_TIMEOUT", "30000"))  # milliseconds
 MAX_DEPTH = int(os.getenv("MAX_DEPTH", "2"))  # Set to 2 per requirements
 RATE_LIMIT_DELAY = float(os.getenv("RATE_LIMIT_DELAY", "1.0"))  # seconds per domain
+DYNAMIC_CONTENT_WAIT = int(os.getenv("DYNAMIC_CONTENT_WAIT", "1000"))  # max ms to wait for JS content
 ENABLE_HTML_ARCHIVE = os.getenv("ENABLE_HTML_ARCHIVE", "false").lower() == "true"
 HTML_ARCHIVE_DIR = Path(os.getenv("HTML_ARCHIVE_DIR", "/tmp/html_archive"))
 JOB_TRACKING_CACHE = Path(os.getenv("JOB_TRACKING_CACHE", ".job_tracking.json"))
@@ -75,6 +68,213 @@ JOB_TRACKING_CACHE = Path(os.getenv("JOB_TRACKING_CACHE", ".job_tracking.json"))
 DEFAULT_DEPARTMENT = "other"
 DEFAULT_ATS_PROVIDER = "hubspot"
 
+# Max domain results waiting to be written to Supabase before crawling blocks
+PERSIST_QUEUE_SIZE = int(os.getenv("PERSIST_QUEUE_SIZE", "16"))
+# Domains scraped at once within a browser batch (one context each)
+SCRAPE_CONCURRENCY = max(1, int(os.getenv("SCRAPE_CONCURRENCY", "3")))
+# Only the HTML is read, so requests for these resource types are aborted
+BLOCK_HEAVY_RESOURCES = os.getenv("BLOCK_HEAVY_RESOURCES", "true").lower() == "true"
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+# Analytics, advertising and session-recording hosts (and their subdomains).
+# Their scripts and beacons never put listings on a page, so they are aborted
+# along with the heavy resource types
+TRACKER_DOMAINS = frozenset({
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "googleadservices.com",
+    "facebook.net",
+    "hotjar.com",
+    "clarity.ms",
+    "hs-analytics.net",
+    "hs-banner.com",
+    "hsadspixel.net",
+    "ads-twitter.com",
+    "licdn.com",
+    "bat.bing.com",
+    "segment.io",
+    "mixpanel.com",
+    "fullstory.com",
+})
+# Path substrings _is_internal_strict blocks (contact pages only when the
+# path isn't career-related). One alternation search is about twice as fast
+# on a short path as an any() loop over the substrings.
+CALENDAR_PATH_RE = re.compile("/calendar|/schedule|/book")
+CONTACT_PATH_RE = re.compile("/contact|/support")
+CAREER_PATH_RE = re.compile("career|job")
+# An absolute http(s) URL with an ASCII host, no path parameters (;) and no
+# whitespace or control characters, i.e. one urlparse would split exactly at
+# the delimiters: (scheme, netloc, path, query), fragment dropped
+SIMPLE_URL_RE = re.compile(
+    r"(https?)://([^/?#\[\]\x00-\x20\x7f-\U0010ffff]*)(/[^?#;\x00-\x20]*)?"
+    r"(?:\?([^#\x00-\x20]*))?(?:#[^\x00-\x20]*)?"
+)
+# Worker processes for the extraction layers, so pages from concurrent
+# domains are parsed on several cores (0 keeps them in a worker thread)
+EXTRACT_PROCESSES = max(0, int(os.getenv("EXTRACT_PROCESSES", "0")))
+
+
+@lru_cache(maxsize=8192)
+def _normalize_url(url: str) -> Optional[str]:
+    """Normalize a URL (memoized, since the same links recur across pages and runs)."""
+    if not url:
+        return None
+
+    # Plain URLs are rebuilt from one regex match; anything urlparse might
+    # treat specially falls through to it
+    match = SIMPLE_URL_RE.fullmatch(url)
+    if match:
+        scheme, netloc, path, query = match.groups(default="")
+        return f"{scheme}://{netloc}{path}?{query}" if query else f"{scheme}://{netloc}{path}"
+
+    try:
+        # Handle relative URLs
+        if not url.startswith(('http://', 'https://')):
+            return None
+
+        # Parse and reconstruct to normalize
+        parsed = urlparse(url)
+
+        # Skip non-http protocols
+        if parsed.scheme not in ('http', 'https'):
+            return None
+
+        # Reconstruct without fragment
+        normalized = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+        if parsed.query:
+            normalized += f"?{parsed.query}"
+
+        return normalized
+
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=8192)
+def _is_internal_url(url: str, root_domain: str) -> bool:
+    """Whether url is on root_domain or a subdomain of it, ignoring www. (memoized)."""
+    try:
+        url_host = urlsplit(url).netloc.lower()
+        root_host = urlsplit(root_domain).netloc.lower()
+
+        # Remove www. prefix
+        if url_host.startswith('www.'):
+            url_host = url_host[4:]
+        if root_host.startswith('www.'):
+            root_host = root_host[4:]
+
+        return url_host == root_host or url_host.endswith('.' + root_host)
+
+    except Exception:
+        return False
+
+
+def _is_tracker_url(url: str) -> bool:
+    """Return True if url is served from one of TRACKER_DOMAINS."""
+    # Test the host and each parent domain, as DomainBlacklist does
+    suffix = urlsplit(url).hostname or ""
+    while True:
+        if suffix in TRACKER_DOMAINS:
+            return True
+        dot = suffix.find('.')
+        if dot == -1:
+            return False
+        suffix = suffix[dot + 1:]
+
+
+async def _route_without_heavy_resources(route):
+    """Playwright route handler that drops requests the scraper never reads."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or _is_tracker_url(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+def _run_extraction_layers(
+    html: str,
+    page_url: str,
+) -> Tuple[List[Dict], List[Tuple[str, object]], str]:
+    """
+    Run the progressive fallback extractors over a career page.
+
+    Blocking; run in a worker thread or process. A module-level function
+    touching no scraper state, so it can be shipped to a process pool.
+
+    Args:
+        html: HTML content
+        page_url: Page URL
+
+    Returns:
+        Tuple of (extracted jobs, per-layer outcomes, page text). Each
+        outcome is (layer name, job count) or (layer name, exception).
+    """
+    # The extractors only read the tree, so the page is parsed once and
+    # shared between all of them
+    all_extracted_jobs = []
+    outcomes = []
+    soup = BeautifulSoup(html, 'lxml')
+    # One multi-layer extractor serves layers 1 and 5; its JSON-LD
+    # extractor's seen set keeps layer 5 from re-emitting layer 1's jobs
+    multi_layer = MultiLayerExtractor(page_url)
+
+    # Layer 1: Structured data (highest priority)
+    try:
+        json_ld_extractor = multi_layer.extractors[0]  # JSON-LD
+        jobs = json_ld_extractor.extract(html, soup)
+        all_extracted_jobs.extend(jobs)
+        outcomes.append(('json_ld', len(jobs)))
+    except Exception as e:
+        outcomes.append(('json_ld', e))
+
+    # Layer 2: Enhanced structured extractors
+    for extractor_class, name in [
+        (MicrodataExtractor, 'microdata'),
+        (OpenGraphExtractor, 'opengraph'),
+        (MetaTagExtractor, 'meta_tags'),
+    ]:
+        try:
+            extractor = extractor_class(page_url)
+            jobs = extractor.extract(html, soup)
+            all_extracted_jobs.extend(jobs)
+            outcomes.append((name, len(jobs)))
+        except Exception as e:
+            outcomes.append((name, e))
+
+    # Layer 3: JavaScript data
+    try:
+        js_extractor = JavaScriptDataExtractor(page_url)
+        jobs = js_extractor.extract(html)
+        all_extracted_jobs.extend(jobs)
+        outcomes.append(('javascript', len(jobs)))
+    except Exception as e:
+        outcomes.append(('javascript', e))
+
+    # Layer 4: CMS-specific patterns
+    try:
+        cms_extractor = CMSPatternExtractor(page_url)
+        jobs = cms_extractor.extract(html, soup)
+        all_extracted_jobs.extend(jobs)
+        outcomes.append(('cms', len(jobs)))
+    except Exception as e:
+        outcomes.append(('cms', e))
+
+    # Layer 5: Standard multi-layer extractor (anchors, buttons, sections, headings)
+    try:
+        jobs = multi_layer.extract_all(html, soup)
+        all_extracted_jobs.extend(jobs)
+        outcomes.append(('multi_layer', len(jobs)))
+    except Exception as e:
+        outcomes.append(('multi_layer', e))
+
+    # Convert HTML to text for classification. Read off the tree already
+    # parsed for the extractors: same text as html_to_text, without a
+    # second parse of the page
+    page_text = soup.get_text(separator=' ', strip=True)
+
+    return all_extracted_jobs, outcomes, page_text
+
 
 class JobScraper:
     """Main scraper engine using Playwright with enterprise features."""
@@ -98,30 +298,103 @@ class JobScraper:
         self.domain_blacklist = DomainBlacklist()
         
         self.browser: Optional[Browser] = None
-        self.visited_urls: Set[str] = set()
-        self.job_cache: Set[str] = set()
+        self._playwright = None
         self.jobs_found: List[Dict] = []
         self.logger = logging.getLogger(self.__class__.__name__)
 
+        # Supabase writes run on a background consumer so crawling the next
+        # domain overlaps with persisting the previous one
+        self._persist_queue: Optional[asyncio.Queue] = None
+        self._persist_task: Optional[asyncio.Task] = None
+
+        # Worker processes for the extraction layers, started on first use
+        # when EXTRACT_PROCESSES is set
+        self._extract_pool: Optional[ProcessPoolExecutor] = None
+
     async def initialize(self):
         """Initialize Playwright browser."""
         self.logger.info("Initializing Playwright browser...")
-        playwright = await async_playwright().start()
-        self.browser = await playwright.chromium.launch(
-            headless=True,
-            args=[
-                "--no-sandbox",
-                "--disable-setuid-sandbox",
-                "--disable-dev-shm-usage",
-                "--disable-gpu",
-            ]
-        )
+        # The Playwright driver outlives browser restarts between batches
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        args = [
+            "--no-sandbox",
+            "--disable-setuid-sandbox",
+            "--disable-dev-shm-usage",
+            "--disable-gpu",
+        ]
+        if BLOCK_HEAVY_RESOURCES:
+            # Chromium then never requests images, so they don't each make a
+            # round trip through the route handler just to be aborted
+            args.append("--blink-settings=imagesEnabled=false")
+        try:
+            self.browser = await self._playwright.chromium.launch(headless=True, args=args)
+        except BaseException:
+            # Don't leave a driver running (possibly kept from the previous
+            # batch) when Chromium fails to launch
+            await self._playwright.stop()
+            self._playwright = None
+            raise
         self.logger.info("Browser initialized")
 
-    async def shutdown(self):
-        """Shutdown browser cleanly and save tracking data."""
+        self._persist_queue = asyncio.Queue(maxsize=PERSIST_QUEUE_SIZE)
+        self._persist_task = asyncio.create_task(self._persist_worker())
+
+    async def block_heavy_resources(self, target):
+        """
+        Abort image, media, font, stylesheet and tracker requests for a context or page.
+
+        Classification only reads the page HTML, and those downloads are most
+        of a career page's bytes. Disabled with BLOCK_HEAVY_RESOURCES=false.
+        """
+        if BLOCK_HEAVY_RESOURCES:
+            await target.route("**/*", _route_without_heavy_resources)
+
+    async def _persist_worker(self):
+        """Consume queued domain results and save them to Supabase off the event loop."""
+        while True:
+            args = await self._persist_queue.get()
+            try:
+                await asyncio.to_thread(self._save_domain_jobs, *args)
+            except Exception as e:
+                # One failed domain must not take the consumer down with it
+                self.logger.error("Failed to persist jobs for %s: %s", args[0], e)
+            finally:
+                self._persist_queue.task_done()
+
+    async def _stop_persistence(self):
+        """Wait for queued Supabase writes to finish, then stop the consumer."""
+        if self._persist_task is None:
+            return
+        # A consumer that already exited would never drain the queue
+        if not self._persist_task.done():
+            await self._persist_queue.join()
+        self._persist_task.cancel()
+        try:
+            await self._persist_task
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            self.logger.error("Supabase persistence worker failed: %s", e)
+        self._persist_task = None
+        self._persist_queue = None
+
+    async def shutdown(self, keep_driver: bool = False):
+        """
+        Shutdown browser cleanly and save tracking data.
+
+        Args:
+            keep_driver: Keep the Playwright driver running so the next
+                         initialize() only has to relaunch the browser.
+        """
+        # Flush pending Supabase writes
+        await self._stop_persistence()
+
+        # Close the pooled ATS API connections
+        await self.ats_fetcher.close()
+
         # Save incremental tracking cache
-        self.incremental_tracker.save_cache()
+        await self.incremental_tracker.save_cache_async()
         
         # Log extraction summary
         summary = self.extraction_reporter.get_extraction_summary()
@@ -132,10 +405,31 @@ class JobScraper:
             summary['total_failures']
         )
         
-        if self.browser:
-            self.logger.info("Shutting down browser...")
-            await self.browser.close()
-            self.logger.info("Browser closed")
+        try:
+            if self.browser:
+                self.logger.info("Shutting down browser...")
+                await self.browser.close()
+                self.browser = None
+                self.logger.info("Browser closed")
+        finally:
+            if self._playwright is not None and not keep_driver:
+                await self._playwright.stop()
+                self._playwright = None
+            # Like the driver, extraction workers outlive browser restarts
+            if self._extract_pool is not None and not keep_driver:
+                self._extract_pool.shutdown(wait=False, cancel_futures=True)
+                self._extract_pool = None
+
+    def _get_extract_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Return the extraction process pool, or None to use a thread."""
+        if EXTRACT_PROCESSES and self._extract_pool is None:
+            # spawn, not fork: this process runs threads (asyncio workers,
+            # the Playwright driver connection) that fork would copy mid-state
+            self._extract_pool = ProcessPoolExecutor(
+                max_workers=EXTRACT_PROCESSES,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._extract_pool
 
     async def scrape_domain(self, domain_url: str, company_name: str, page: Optional[Page] = None, run_id: Optional[str] = None) -> List[Dict]:
         """
@@ -164,16 +458,47 @@ class JobScraper:
         self.logger.info("[DOMAIN] Starting discovery...")
         self.logger.info(f"Root URL: {domain_url}")
         
-        # Reset per-domain state
-        self.visited_urls.clear()
+        # Per-domain state is local so several domains can be scraped at once
+        visited_urls: Set[str] = set()
         domain_jobs = []
 
+        page_created_here = False
         try:
-            # Start with the homepage
-            await self._crawl_page(domain_url, company_name, domain_url, depth=0, jobs_list=domain_jobs, page=page)
+            # Use the provided page, or create one for this domain
+            if page is None:
+                if not self.browser:
+                    raise RuntimeError("Browser not initialized. Call initialize() first.")
+                page = await self.browser.new_page()
+                page_created_here = True
+                await self.block_heavy_resources(page)
+
+            # Breadth-first from the homepage, except that links whose URL
+            # looks like a careers page (/careers, /jobs) jump the queue so
+            # the page cap is spent on the likeliest pages first. Entries are
+            # (priority, depth, order, url); order keeps ties first-in-first-out.
+            queue = [(0, 0, 0, domain_url)]
+            enqueued = 1
+            while queue and not domain_jobs and len(visited_urls) < MAX_PAGES_PER_DOMAIN:
+                _, depth, _, url = heapq.heappop(queue)
+                career_links = await self._crawl_page(
+                    url, company_name, domain_url, depth,
+                    jobs_list=domain_jobs, visited_urls=visited_urls, page=page,
+                )
+                if depth < MAX_DEPTH:
+                    # Limit career links per page
+                    for link in career_links[:5]:
+                        if self._normalize_url(link) in visited_urls:
+                            continue
+                        priority = 0 if CAREER_PATH_RE.search(urlsplit(link).path.lower()) else 1
+                        heapq.heappush(queue, (priority, depth + 1, enqueued, link))
+                        enqueued += 1
 
         except Exception as e:
             self.logger.error("Error scraping domain %s: %s", domain_url, e)
+        finally:
+            # Only close the page if we created it here
+            if page_created_here:
+                await page.close()
 
         # Enhanced completion logging per requirements
         self.logger.info(f"[COMPLETE] Domain: {domain_url} | Jobs found: {len(domain_jobs)}")
@@ -195,57 +520,64 @@ class JobScraper:
         
         # Save jobs to Supabase (if configured)
         if run_id and domain_jobs:
-            try:
-                # Extract clean domain from URL
-                parsed = urlparse(domain_url)
-                domain = parsed.netloc
-                if domain.startswith('www.'):
-                    domain = domain[4:]
-                
-                # Get or create company
-                company_id = get_or_create_company(
-                    client=get_supabase_client(),
-                    name=company_name,
-                    domain=domain,
-                    source_url=domain_url,
-                )
-                
-                if company_id:
-                    # Prepare jobs with all required fields
-                    # Use single timestamp for all jobs in this batch for consistency
-                    batch_timestamp = datetime.utcnow().isoformat()
-                    prepared_jobs = []
-                    for job in domain_jobs:
-                        prepared_job = {
-                            "job_title": job.get("title") or job.get("job_title") or "Unknown",
-                            "job_url": job.get("url") or job.get("job_url") or "",
-                            "department": job.get("department") or DEFAULT_DEPARTMENT,
-                            "location": job.get("location") or "",
-                            "remote_type": job.get("remote_type") or job.get("location_type") or "",
-                            "description": job.get("summary") or job.get("description") or "",
-                            "posted_at": job.get("posted_at"),
-                            "scraped_at": job.get("timestamp") or batch_timestamp,
-                            "hash": hashlib.sha256(f"{company_id}:{job.get('title', '')}:{job.get('url', '')}".encode()).hexdigest(),
-                            "active": True,
-                            "ats_provider": job.get("ats_provider") or job.get("extraction_source") or DEFAULT_ATS_PROVIDER,
-                        }
-                        prepared_jobs.append(prepared_job)
-                    
-                    save_jobs_for_domain(
-                        run_id=run_id,
-                        company_id=company_id,
-                        jobs=prepared_jobs,
-                    )
-                    
-                    self.logger.info(f"Saved {len(prepared_jobs)} jobs to Supabase for domain={domain}, run_id={run_id}")
-            except Exception as e:
-                self.logger.error(
-                    "Error saving jobs to Supabase",
-                    extra={"domain": domain_url, "run_id": run_id, "error": str(e)},
-                )
-        
+            if self._persist_task is not None and not self._persist_task.done():
+                await self._persist_queue.put((domain_url, company_name, run_id, domain_jobs))
+            else:
+                await asyncio.to_thread(self._save_domain_jobs, domain_url, company_name, run_id, domain_jobs)
+
         return domain_jobs
 
+    def _save_domain_jobs(self, domain_url: str, company_name: str, run_id: str, domain_jobs: List[Dict]):
+        """Save a domain's jobs to Supabase (blocking; run in a worker thread)."""
+        try:
+            # Extract clean domain from URL
+            parsed = urlsplit(domain_url)
+            domain = parsed.netloc
+            if domain.startswith('www.'):
+                domain = domain[4:]
+
+            # Get or create company
+            company_id = get_or_create_company(
+                client=get_supabase_client(),
+                name=company_name,
+                domain=domain,
+                source_url=domain_url,
+            )
+
+            if company_id:
+                # Prepare jobs with all required fields
+                # Use single timestamp for all jobs in this batch for consistency
+                batch_timestamp = datetime.utcnow().isoformat()
+                prepared_jobs = []
+                for job in domain_jobs:
+                    prepared_job = {
+                        "job_title": job.get("title") or job.get("job_title") or "Unknown",
+                        "job_url": job.get("url") or job.get("job_url") or "",
+                        "department": job.get("department") or DEFAULT_DEPARTMENT,
+                        "location": job.get("location") or "",
+                        "remote_type": job.get("remote_type") or job.get("location_type") or "",
+                        "description": job.get("summary") or job.get("description") or "",
+                        "posted_at": job.get("posted_at"),
+                        "scraped_at": job.get("timestamp") or batch_timestamp,
+                        "hash": hashlib.sha256(f"{company_id}:{job.get('title', '')}:{job.get('url', '')}".encode()).hexdigest(),
+                        "active": True,
+                        "ats_provider": job.get("ats_provider") or job.get("extraction_source") or DEFAULT_ATS_PROVIDER,
+                    }
+                    prepared_jobs.append(prepared_job)
+
+                save_jobs_for_domain(
+                    run_id=run_id,
+                    company_id=company_id,
+                    jobs=prepared_jobs,
+                )
+
+                self.logger.info(f"Saved {len(prepared_jobs)} jobs to Supabase for domain={domain}, run_id={run_id}")
+        except Exception as e:
+            self.logger.error(
+                "Error saving jobs to Supabase",
+                extra={"domain": domain_url, "run_id": run_id, "error": str(e)},
+            )
+
     async def _crawl_page(
         self,
         url: str,
@@ -253,42 +585,43 @@ class JobScraper:
         root_domain: str,
         depth: int,
         jobs_list: List[Dict],
-        page: Optional[Page] = None
-    ):
+        visited_urls: Set[str],
+        page: Page,
+    ) -> List[str]:
         """
-        Recursively crawl a page.
+        Crawl a single page of a domain.
 
         Args:
             url: Page URL to crawl
             company_name: Company name
             root_domain: Root domain for this crawl
-            depth: Current recursion depth
+            depth: Link distance of this page from the homepage
             jobs_list: List to append found jobs to
-            page: Optional Page instance. If provided for depth=0, will be used for first page.
-                  Subsequent recursive calls will create new pages from browser.
-        """
-        # Check limits
-        if depth > MAX_DEPTH:
-            self.logger.debug("Max depth reached for %s", url)
-            return
+            visited_urls: URLs already crawled for this domain
+            page: Page instance to navigate
 
-        if len(self.visited_urls) >= MAX_PAGES_PER_DOMAIN:
+        Returns:
+            Career links to follow from this page. Empty for career pages,
+            since crawling stops once one is found, and for pages that were
+            skipped or failed to load.
+        """
+        if len(visited_urls) >= MAX_PAGES_PER_DOMAIN:
             self.logger.debug("Max pages limit reached for domain")
-            return
+            return []
 
         # Normalize URL
         normalized_url = self._normalize_url(url)
         if not normalized_url:
-            return
+            return []
 
         # Check if already visited
-        if normalized_url in self.visited_urls:
-            return
+        if normalized_url in visited_urls:
+            return []
 
         # Check if should skip domain
         if self._should_skip_domain(normalized_url):
             self.logger.debug("Skipping blocked domain: %s", normalized_url)
-            return
+            return []
 
         # Check if internal to root domain
         if not self._is_internal_strict(normalized_url, root_domain):
@@ -297,97 +630,81 @@ class JobScraper:
                 self.logger.info("Following allowed ATS redirect: %s", normalized_url)
             elif self.ats_detector.is_banned_redirect(normalized_url):
                 self.logger.info("Blocking banned redirect: %s", normalized_url)
-                return
+                return []
             else:
                 self.logger.debug("Skipping external URL: %s", normalized_url)
-                return
+                return []
 
         # Check robots.txt
         can_crawl = await self.robots_checker.can_crawl(normalized_url)
         if not can_crawl:
             self.logger.debug("Blocked by robots.txt: %s", normalized_url)
-            return
+            return []
 
         # Apply rate limiting
-        domain = urlparse(normalized_url).netloc
+        domain = urlsplit(normalized_url).netloc
         delay = self.rate_limiter.get_delay(domain)
         if delay > 0:
             self.logger.debug("Rate limiting: waiting %.1fs for %s", delay, domain)
             await asyncio.sleep(delay)
 
         # Mark as visited
-        self.visited_urls.add(normalized_url)
-        self.logger.debug("Crawling: %s (depth=%d)", normalized_url, depth)
+        visited_urls.add(normalized_url)
+
+        # A link to a hosted ATS board is fetched from the ATS API directly;
+        # loading the board page would only lead to the same API call
+        ats_type = self.ats_detector.detect_ats_from_url(normalized_url)
+        if ats_type:
+            self.logger.info(f"[ATS] {ats_type} board linked. Scraping via API without loading the page.")
+            await self._extract_from_ats(ats_type, normalized_url, company_name, jobs_list)
+            return []
 
-        # Ensure browser is initialized (needed for recursive calls)
-        if not self.browser:
-            raise RuntimeError("Browser not initialized. Call initialize() first.")
+        self.logger.debug("Crawling: %s (depth=%d)", normalized_url, depth)
 
         try:
-            # Use provided page for first page, or create a new one
-            page_created_here = False
-            if page is None:
-                page = await self.browser.new_page()
-                page_created_here = True
-            
+            # Navigate to the page with timeout
+            await page.goto(normalized_url, timeout=PAGE_TIMEOUT, wait_until="domcontentloaded")
+
+            # Wait for dynamic content, but stop as soon as the network
+            # settles instead of always sleeping the full window
             try:
-                # Navigate to the page with timeout
-                await page.goto(normalized_url, timeout=PAGE_TIMEOUT, wait_until="domcontentloaded")
-                
-                # Wait a bit for dynamic content
-                await page.wait_for_timeout(1000)
-                
-                # Get page content
-                html = await page.content()
-                
-                # Record success
-                self.rate_limiter.record_success(domain)
-                
-                # Check if this is a career page
-                is_career = self.career_detector.is_career_page(normalized_url, html)
-                
-                if is_career:
-                    # Enhanced logging per requirements
-                    self.logger.info(f"[CAREERS] Navigating to: {normalized_url}")
-                    
-                    # Extract jobs from this page
-                    await self._extract_jobs_from_page(html, normalized_url, company_name, jobs_list)
-                    
-                    # IMPORTANT: Stop crawling once career page is found (per requirements)
-                    # This prevents unnecessary deep crawling
-                    return
-                else:
-                    # Look for career links on non-career pages
-                    career_links = self.career_detector.get_career_links(html, normalized_url)
-                    
-                    if career_links:
-                        self.logger.debug(
-                            "Found career link candidates",
-                            extra={
-                                "url": normalized_url,
-                                "candidates": career_links[:5],
-                                "count": len(career_links)
-                            }
-                        )
-                    
-                    # Recursively crawl career links
-                    for career_link in career_links[:5]:  # Limit career links per page
-                        await self._crawl_page(
-                            career_link,
-                            company_name,
-                            root_domain,
-                            depth + 1,
-                            jobs_list,
-                            page=None  # Force new page for each recursive URL to maintain isolation
-                        )
-                        # If we found jobs, stop crawling (per requirements)
-                        if jobs_list:
-                            return
-                
-            finally:
-                # Only close the page if we created it here
-                if page_created_here:
-                    await page.close()
+                await page.wait_for_load_state("networkidle", timeout=DYNAMIC_CONTENT_WAIT)
+            except PlaywrightTimeout:
+                pass
+
+            # Get page content
+            html = await page.content()
+
+            # Record success
+            self.rate_limiter.record_success(domain)
+
+            # Check if this is a career page
+            is_career = self.career_detector.is_career_page(normalized_url, html)
+
+            if is_career:
+                # Enhanced logging per requirements
+                self.logger.info(f"[CAREERS] Navigating to: {normalized_url}")
+
+                # Extract jobs from this page
+                await self._extract_jobs_from_page(html, normalized_url, company_name, jobs_list)
+
+                # IMPORTANT: Stop crawling once career page is found (per requirements)
+                # This prevents unnecessary deep crawling
+                return []
+
+            # Look for career links on non-career pages
+            career_links = self.career_detector.get_career_links(html, normalized_url)
+
+            if career_links:
+                self.logger.debug(
+                    "Found career link candidates",
+                    extra={
+                        "url": normalized_url,
+                        "candidates": career_links[:5],
+                        "count": len(career_links)
+                    }
+                )
+            return career_links
 
         except PlaywrightTimeout:
             self.logger.warning("Timeout loading page: %s", normalized_url)
@@ -395,6 +712,7 @@ class JobScraper:
         except Exception as e:
             self.logger.warning("Error crawling page %s: %s", normalized_url, e)
             self.rate_limiter.record_failure(domain)
+        return []
 
     async def _extract_jobs_from_page(
         self,
@@ -434,65 +752,37 @@ class JobScraper:
             await self._extract_from_ats(ats_type, page_url, company_name, jobs_list)
             return
 
-        # Progressive fallback extraction
-        all_extracted_jobs = []
-
-        # Layer 1: Structured data (highest priority)
-        try:
-            json_ld_extractor = MultiLayerExtractor(page_url).extractors[0]  # JSON-LD
-            jobs = json_ld_extractor.extract(html)
-            all_extracted_jobs.extend(jobs)
-            self.extraction_reporter.log_extraction_success('json_ld', page_url, len(jobs))
-        except Exception as e:
-            self.extraction_reporter.log_extractor_failure('json_ld', page_url, e)
-
-        # Layer 2: Enhanced structured extractors
-        for extractor_class, name in [
-            (MicrodataExtractor, 'microdata'),
-            (OpenGraphExtractor, 'opengraph'),
-            (MetaTagExtractor, 'meta_tags'),
-        ]:
-            try:
-                extractor = extractor_class(page_url)
-                jobs = extractor.extract(html)
-                all_extracted_jobs.extend(jobs)
-                self.extraction_reporter.log_extraction_success(name, page_url, len(jobs))
-            except Exception as e:
-                self.extraction_reporter.log_extractor_failure(name, page_url, e)
-
-        # Layer 3: JavaScript data
-        try:
-            js_extractor = JavaScriptDataExtractor(page_url)
-            jobs = js_extractor.extract(html)
-            all_extracted_jobs.extend(jobs)
-            self.extraction_reporter.log_extraction_success('javascript', page_url, len(jobs))
-        except Exception as e:
-            self.extraction_reporter.log_extractor_failure('javascript', page_url, e)
-
-        # Layer 4: CMS-specific patterns
-        try:
-            cms_extractor = CMSPatternExtractor(page_url)
-            jobs = cms_extractor.extract(html)
-            all_extracted_jobs.extend(jobs)
-            self.extraction_reporter.log_extraction_success('cms', page_url, len(jobs))
-        except Exception as e:
-            self.extraction_reporter.log_extractor_failure('cms', page_url, e)
-
-        # Layer 5: Standard multi-layer extractor (anchors, buttons, sections, headings)
-        try:
-            extractor = MultiLayerExtractor(page_url)
-            jobs = extractor.extract_all(html)
-            all_extracted_jobs.extend(jobs)
-            self.extraction_reporter.log_extraction_success('multi_layer', page_url, len(jobs))
-        except Exception as e:
-            self.extraction_reporter.log_extractor_failure('multi_layer', page_url, e)
-
-        # Convert HTML to text for classification
-        soup = BeautifulSoup(html, 'lxml')
-        page_text = soup.get_text(separator=' ', strip=True)
+        # The extraction layers are CPU-bound parsing, so they run in a worker
+        # thread (or process) and other domains' page loads keep progressing
+        # meanwhile
+        extract_pool = self._get_extract_pool()
+        if extract_pool is not None:
+            all_extracted_jobs, layer_outcomes, page_text = await asyncio.get_running_loop().run_in_executor(
+                extract_pool, _run_extraction_layers, html, page_url
+            )
+        else:
+            all_extracted_jobs, layer_outcomes, page_text = await asyncio.to_thread(
+                _run_extraction_layers, html, page_url
+            )
+        # Report on the event loop; the reporter's counters aren't thread-safe
+        for name, result in layer_outcomes:
+            if isinstance(result, Exception):
+                self.extraction_reporter.log_extractor_failure(name, page_url, result)
+            else:
+                self.extraction_reporter.log_extraction_success(name, page_url, result)
+
+        # Classification only looks at the page text, so score the page once
+        # and hand each job its own copy. The keyword scan over a long page
+        # takes milliseconds, so it runs off the event loop too.
+        page_classification = (
+            await asyncio.to_thread(self.role_classifier.classify_and_score, page_text, {})
+            if all_extracted_jobs else None
+        )
 
-        # Process and deduplicate jobs
+        # Process and deduplicate jobs. Every job from one page is stamped
+        # with the time the page was processed.
         jobs_added = 0
+        timestamp = datetime.utcnow().isoformat() + 'Z'
         for job_data in all_extracted_jobs:
             # Cross-layer deduplication
             if self.job_deduplicator.is_duplicate(job_data, use_fuzzy=True):
@@ -504,12 +794,12 @@ class JobScraper:
                 continue
 
             # Classify and score the job
-            classification = self.role_classifier.classify_and_score(page_text, normalized_job)
-            
-            if not classification:
+            if not page_classification:
                 self.logger.debug("Job did not meet scoring threshold: %s", normalized_job.get('title'))
                 continue
 
+            classification = dict(page_classification, signals=list(page_classification['signals']))
+
             # Check role filters
             if not self.role_classifier.should_include_role(
                 classification['role'],
@@ -532,7 +822,7 @@ class JobScraper:
                 "department": normalized_job.get('department', 'other'),
                 "seniority": normalized_job.get('seniority', 'mid'),
                 "employment_type": normalized_job.get('employment_type', 'full_time'),
-                "timestamp": datetime.utcnow().isoformat() + 'Z',
+                "timestamp": timestamp,
                 "source_page": page_url,
                 "extraction_source": job_data.get('source', 'unknown'),
             }
@@ -611,7 +901,8 @@ class JobScraper:
                 self.logger.warning("ATS type %s not supported yet", ats_type)
                 return
 
-            # Process ATS jobs
+            # Process ATS jobs, all stamped with the time of the fetch
+            timestamp = datetime.utcnow().isoformat() + 'Z'
             for job in jobs:
                 # Normalize
                 normalized_job = self._normalize_job(job, "")
@@ -623,7 +914,7 @@ class JobScraper:
                 jobs_list.append({
                     **normalized_job,
                     "company": company_name,
-                    "timestamp": datetime.utcnow().isoformat() + 'Z',
+                    "timestamp": timestamp,
                     "extraction_source": f"ats_{ats_type}",
                 })
                 self.incremental_tracker.add_job(company_name, normalized_job)
@@ -656,9 +947,8 @@ class JobScraper:
         # Classify title
         title_classification = self.title_classifier.classify_title(normalized_title)
         
-        # Detect employment type
-        text_for_analysis = f"{title} {summary} {context_text}"
-        employment_type = self.job_normalizer.normalize_employment_type(text_for_analysis)
+        # Detect employment type (the page text is scanned once per page)
+        employment_type = self.job_normalizer.normalize_employment_type(f"{title} {summary}", context_text)
         
         return {
             'title': normalized_title,
@@ -680,30 +970,7 @@ class JobScraper:
 
     def _normalize_url(self, url: str) -> Optional[str]:
         """Normalize a URL."""
-        if not url:
-            return None
-
-        try:
-            # Handle relative URLs
-            if not url.startswith(('http://', 'https://')):
-                return None
-
-            # Parse and reconstruct to normalize
-            parsed = urlparse(url)
-            
-            # Skip non-http protocols
-            if parsed.scheme not in ('http', 'https'):
-                return None
-
-            # Reconstruct without fragment
-            normalized = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
-            if parsed.query:
-                normalized += f"?{parsed.query}"
-
-            return normalized
-
-        except Exception:
-            return None
+        return _normalize_url(url)
 
     def _should_skip_domain(self, url: str) -> bool:
         """
@@ -715,39 +982,13 @@ class JobScraper:
         - HubSpot ecosystem domains
         - Analytics/tracking domains
         - Unrelated major domains
-        - Legacy SKIP_DOMAINS for backwards compatibility
+        - Legacy SKIP_DOMAINS entries (merged into the blacklist)
         """
-        # Check comprehensive blacklist
-        if self.domain_blacklist.is_blacklisted_domain(url):
-            return True
-        
-        # Also check legacy SKIP_DOMAINS for backwards compatibility
-        try:
-            host = urlparse(url).netloc.lower()
-            if host.startswith('www.'):
-                host = host[4:]
-
-            return any(host == sd or host.endswith('.' + sd) for sd in SKIP_DOMAINS)
-
-        except Exception:
-            return True
+        return self.domain_blacklist.is_blacklisted_domain(url)
 
     def _is_internal(self, url: str, root_domain: str) -> bool:
         """Check if a URL is internal to the root domain."""
-        try:
-            url_host = urlparse(url).netloc.lower()
-            root_host = urlparse(root_domain).netloc.lower()
-
-            # Remove www. prefix
-            if url_host.startswith('www.'):
-                url_host = url_host[4:]
-            if root_host.startswith('www.'):
-                root_host = root_host[4:]
-
-            return url_host == root_host or url_host.endswith('.' + root_host)
-
-        except Exception:
-            return False
+        return _is_internal_url(url, root_domain)
 
     def _is_internal_strict(self, url: str, root_domain: str) -> bool:
         """
@@ -763,17 +1004,17 @@ class JobScraper:
             return False
 
         try:
-            parsed = urlparse(url)
+            parsed = urlsplit(url)
             path = parsed.path.lower()
             
             # Block calendar pages
-            if any(blocked in path for blocked in ['/calendar', '/schedule', '/book']):
+            if CALENDAR_PATH_RE.search(path):
                 self.logger.debug("Blocking calendar page: %s", url)
                 return False
             
             # Block contact/support pages (unless they're career-related)
-            if any(blocked in path for blocked in ['/contact', '/support']):
-                if 'career' not in path and 'job' not in path:
+            if CONTACT_PATH_RE.search(path):
+                if not CAREER_PATH_RE.search(path):
                     self.logger.debug("Blocking contact page: %s", url)
                     return False
             
@@ -834,12 +1075,110 @@ async def scrape_all_domains(domains_file: str, progress_callback=None) -> Tuple
 
     # Batch size for browser restarts
     BATCH_SIZE = 5
+    total_domains = len(domains)
 
     # Create a single scraper instance (browser lifecycle managed per batch)
     scraper = JobScraper()
 
+    # Domains within a batch share the browser but run in separate contexts,
+    # at most SCRAPE_CONCURRENCY at a time
+    semaphore = asyncio.Semaphore(SCRAPE_CONCURRENCY)
+    domains_done = 0
+
+    async def scrape_one(idx: int, domain_data: Dict):
+        """Scrape one domain (1-indexed position idx) in a fresh browser context."""
+        nonlocal success_count, failed_count, domains_done
+
+        website = domain_data.get('website')
+        company_name = domain_data.get('title', website)
+
+        if not website:
+            logger.warning(
+                "Skipping entry with no website",
+                extra={"index": idx, "data": domain_data}
+            )
+            domains_done += 1
+            return
+
+        async with semaphore:
+            logger.info(
+                "🌐 Starting domain [%d/%d]",
+                idx,
+                total_domains,
+                extra={"domain": website, "company": company_name}
+            )
+
+            # Create a new isolated browser context for this domain
+            context = None
+            page = None
+            counted = False
+            try:
+                context = await scraper.browser.new_context()
+                await scraper.block_heavy_resources(context)
+                page = await context.new_page()
+
+                # Scrape the domain using the isolated context's page, passing run_id
+                jobs = await scraper.scrape_domain(website, company_name, page=page, run_id=run_id)
+                all_jobs.extend(jobs)
+                domains_done += 1
+                counted = True
+
+                if jobs:
+                    success_count += 1
+                    logger.info(
+                        "✅ Domain complete",
+                        extra={
+                            "domain": website,
+                            "jobs_found": len(jobs),
+                            "progress": f"{domains_done}/{total_domains}"
+                        }
+                    )
+                else:
+                    logger.info(
+                        "ℹ️  Domain complete - no jobs found",
+                        extra={
+                            "domain": website,
+                            "progress": f"{domains_done}/{total_domains}"
+                        }
+                    )
+
+                # Call progress callback if provided (domains finish out of
+                # order, so report how many are done rather than the position)
+                if progress_callback:
+                    await progress_callback(domains_done, total_domains, jobs, all_jobs)
+
+                # Update scrape run progress after each domain
+                if run_id:
+                    update_scrape_run(run_id, {
+                        "last_domain": website,
+                        "domains_completed": domains_done
+                    })
+
+            except Exception as e:
+                failed_count += 1
+                if not counted:
+                    domains_done += 1
+                logger.error(
+                    "❌ Domain failed",
+                    extra={
+                        "domain": website,
+                        "error": str(e),
+                        "progress": f"{domains_done}/{total_domains}"
+                    },
+                    exc_info=False
+                )
+
+                # Call progress callback even on failure
+                if progress_callback:
+                    await progress_callback(domains_done, total_domains, [], all_jobs)
+            finally:
+                # Always close the browser context after each domain
+                if page:
+                    await page.close()
+                if context:
+                    await context.close()
+
     # Process domains in batches of BATCH_SIZE
-    total_domains = len(domains)
     for batch_start in range(0, total_domains, BATCH_SIZE):
         batch_end = min(batch_start + BATCH_SIZE, total_domains)
         batch_domains = domains[batch_start:batch_end]
@@ -848,95 +1187,23 @@ async def scrape_all_domains(domains_file: str, progress_callback=None) -> Tuple
         logger.info(f"Starting browser for batch {batch_start + 1}-{batch_end}")
         await scraper.initialize()
 
+        batch_completed = False
         try:
-            # Scrape each domain in this batch with a new browser context
-            for batch_idx, domain_data in enumerate(batch_domains):
-                # Global 1-indexed position for this domain
-                idx = batch_start + batch_idx + 1
-                
-                website = domain_data.get('website')
-                company_name = domain_data.get('title', website)
-
-                if not website:
-                    logger.warning(
-                        "Skipping entry with no website",
-                        extra={"index": idx, "data": domain_data}
-                    )
-                    continue
-
-                logger.info(
-                    "🌐 Starting domain [%d/%d]",
-                    idx,
-                    total_domains,
-                    extra={"domain": website, "company": company_name}
-                )
-
-                # Create a new isolated browser context for this domain
-                context = None
-                page = None
-                try:
-                    context = await scraper.browser.new_context()
-                    page = await context.new_page()
-                    
-                    # Scrape the domain using the isolated context's page, passing run_id
-                    jobs = await scraper.scrape_domain(website, company_name, page=page, run_id=run_id)
-                    all_jobs.extend(jobs)
-                    
-                    if jobs:
-                        success_count += 1
-                        logger.info(
-                            "✅ Domain complete",
-                            extra={
-                                "domain": website,
-                                "jobs_found": len(jobs),
-                                "progress": f"{idx}/{total_domains}"
-                            }
-                        )
-                    else:
-                        logger.info(
-                            "ℹ️  Domain complete - no jobs found",
-                            extra={
-                                "domain": website,
-                                "progress": f"{idx}/{total_domains}"
-                            }
-                        )
-                    
-                    # Call progress callback if provided
-                    if progress_callback:
-                        await progress_callback(idx, total_domains, jobs, all_jobs)
-                    
-                    # Update scrape run progress after each domain
-                    if run_id:
-                        update_scrape_run(run_id, {
-                            "last_domain": website,
-                            "domains_completed": idx
-                        })
-                        
-                except Exception as e:
-                    failed_count += 1
-                    logger.error(
-                        "❌ Domain failed",
-                        extra={
-                            "domain": website,
-                            "error": str(e),
-                            "progress": f"{idx}/{total_domains}"
-                        },
-                        exc_info=False
-                    )
-                    
-                    # Call progress callback even on failure
-                    if progress_callback:
-                        await progress_callback(idx, total_domains, [], all_jobs)
-                finally:
-                    # Always close the browser context after each domain
-                    if page:
-                        await page.close()
-                    if context:
-                        await context.close()
+            # Scrape this batch's domains concurrently, each in its own context
+            await asyncio.gather(*(
+                scrape_one(batch_start + batch_idx + 1, domain_data)
+                for batch_idx, domain_data in enumerate(batch_domains)
+            ))
+            batch_completed = True
         finally:
             # Always shutdown the browser after each batch is processed
             logger.info(f"Shutting down browser after batch {batch_start + 1}-{batch_end}")
-            await scraper.shutdown()
+            if batch_completed and batch_end < total_domains:
+                # Only the browser is recycled; the driver is reused by the next
+                # batch. A batch that raised (or was cancelled) stops it too.
+                await scraper.shutdown(keep_driver=True)
+            else:
+                await scraper.shutdown()
     
     # Mark scrape run as finished
     if run_id:
@@ -959,6 +1226,61 @@ async def scrape_all_domains(domains_file: str, progress_callback=None) -> Tuple
     return all_jobs, run_id
 
 
+@lru_cache(maxsize=4)
+def _load_domains_cached(path_str: str, mtime_ns: int) -> Tuple[Tuple[str, str], ...]:
+    """
+    Parse a domains file into ``(website, title)`` pairs.
+
+    Keyed on the file's mtime so an edited file is re-read, while repeated
+    loads of an unchanged file skip the disk read and JSON parse.
+    """
+    data = orjson.loads(Path(path_str).read_bytes())
+
+    if not isinstance(data, list):
+        raise ValueError("Domains file must contain a JSON array")
+
+    # Keyed by _domain_key so sites already listed are skipped in the same
+    # pass (datasets merged from several sources often repeat a domain with
+    # a different scheme, www. or slash); the first occurrence wins
+    unique: Dict[str, Tuple[str, str]] = {}
+    for domain in filter(None, map(_domain_entry, data)):
+        unique.setdefault(_domain_key(domain[0]), domain)
+    domains = tuple(unique.values())
+
+    duplicates = len(data) - len(domains)
+    if duplicates:
+        logger.info("Skipped %d duplicate or empty domain entries in %s", duplicates, path_str)
+
+    return domains
+
+
+def _domain_entry(entry) -> Optional[Tuple[str, str]]:
+    """Turn one domains-file entry into a (website, title) pair, or None if unusable."""
+    if isinstance(entry, str):
+        website, title = entry, entry
+    elif isinstance(entry, dict):
+        website = entry.get("website") or entry.get("url")
+        title = entry.get("title") or website
+    else:
+        return None
+
+    if not website:
+        return None
+    return website, title
+
+
+def _domain_key(website: str) -> str:
+    """Reduce a website URL to the identity used for de-duplicating domains."""
+    key = website.strip().lower()
+    for prefix in ("https://", "http://"):
+        if key.startswith(prefix):
+            key = key[len(prefix):]
+            break
+    if key.startswith("www."):
+        key = key[4:]
+    return key.rstrip("/")
+
+
 def load_domains(file_path: str) -> List[Dict]:
     """
     Load domains from JSON file.
@@ -966,6 +1288,9 @@ def load_domains(file_path: str) -> List[Dict]:
     Supports two formats:
     - Array of objects: [{"website": "...", "title": "..."}]
     - Array of strings: ["https://example.com"]
+
+    Parsed results are cached per file modification time; callers always
+    receive fresh dicts they are free to mutate.
     """
     path = Path(file_path)
     if not path.exists():
@@ -973,28 +1298,15 @@ def load_domains(file_path: str) -> List[Dict]:
         return []
 
     try:
-        with path.open() as f:
-            data = json.load(f)
-
-        if not isinstance(data, list):
-            logger.error("Domains file must contain a JSON array")
-            return []
-
-        domains = []
-        for entry in data:
-            if isinstance(entry, str):
-                domains.append({"website": entry, "title": entry})
-            elif isinstance(entry, dict):
-                website = entry.get("website") or entry.get("url")
-                title = entry.get("title") or website
-                if website:
-                    domains.append({"website": website, "title": title})
-
-        return domains
+        entries = _load_domains_cached(str(path.resolve()), path.stat().st_mtime_ns)
+        return [{"website": website, "title": title} for website, title in entries]
 
     except json.JSONDecodeError as e:
         logger.error("Invalid JSON in domains file: %s", e)
         return []
+    except ValueError as e:
+        logger.error("%s", e)
+        return []
     except Exception as e:
         logger.error("Error loading domains file: %s", e)
         return []
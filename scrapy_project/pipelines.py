@@ -1,6 +1,7 @@
 import asyncio
 import hashlib
 import json
+import logging
 import os
 from pathlib import Path
 
@@ -17,34 +18,88 @@ JOB_CACHE_PATH = Path(os.getenv("JOB_CACHE_PATH", ".job_cache.json"))
 ROLE_FILTER = {r.strip() for r in os.getenv("ROLE_FILTER", "").split(",") if r.strip()}
 REMOTE_ONLY = os.getenv("REMOTE_ONLY", "false").lower() == "true"
 
+logger = logging.getLogger(__name__)
+
 
 class JobCache:
+    """
+    Seen-job hashes backed by an append-only, newline-delimited log.
+
+    Hashes added during a crawl are held in memory and only appended to the
+    file on ``persist``, so each flush writes just the new entries. Caches in
+    the legacy JSON-list format are read and rewritten as a log on the next
+    flush.
+
+    Entries written before job keys moved from SHA-256 to BLAKE2b are kept in
+    ``legacy`` and re-keyed by ``migrate`` the first time their job is seen
+    again, so already-notified jobs stay quiet across the switch.
+    """
+
+    # Hex length of the pre-BLAKE2b SHA-256 job keys
+    LEGACY_HASH_LEN = 64
+
     def __init__(self, path: Path):
         self.path = path
+        self._pending = []
+        self._rewrite = False
         self.seen = self._load()
+        self.legacy = {h for h in self.seen if len(h) == self.LEGACY_HASH_LEN}
+        self.seen -= self.legacy
 
     def _load(self):
-        if self.path.exists():
+        if not self.path.exists():
+            return set()
+        try:
+            text = self.path.read_text()
+        except OSError:
+            return set()
+
+        if text.lstrip().startswith("["):
+            self._rewrite = True
             try:
-                with self.path.open() as f:
-                    data = json.load(f)
-                return set(data)
-            except (json.JSONDecodeError, OSError):
+                return set(json.loads(text))
+            except json.JSONDecodeError:
                 return set()
-        return set()
+
+        return {line for line in text.splitlines() if line}
 
     def contains(self, job_hash: str) -> bool:
         return job_hash in self.seen
 
-    def add(self, job_hash: str):
+    def migrate(self, legacy_hash: str, job_hash: str) -> bool:
+        """Re-key a legacy entry to ``job_hash``; returns False if it isn't cached."""
+        if legacy_hash not in self.legacy:
+            return False
+        self.legacy.discard(legacy_hash)
         self.seen.add(job_hash)
+        # The log is append-only, so dropping the old key needs a rewrite
+        self._rewrite = True
+        return True
+
+    def add(self, job_hash: str):
+        if job_hash not in self.seen:
+            self.seen.add(job_hash)
+            self._pending.append(job_hash)
 
     def persist(self):
         try:
-            with self.path.open("w") as f:
-                json.dump(sorted(self.seen), f)
-        except OSError:
-            pass
+            if self._rewrite:
+                # Write the full log alongside and swap it in, so a crash
+                # mid-write never leaves a truncated cache behind
+                tmp_path = self.path.with_name(self.path.name + ".tmp")
+                with tmp_path.open("w") as f:
+                    f.writelines(f"{h}\n" for h in self.seen)
+                    f.writelines(f"{h}\n" for h in self.legacy)
+                tmp_path.replace(self.path)
+                self._rewrite = False
+            elif self._pending:
+                with self.path.open("a") as f:
+                    f.writelines(f"{h}\n" for h in self._pending)
+            self._pending.clear()
+        except OSError as e:
+            # Unsaved hashes stay pending (or the rewrite stays due) for the
+            # next flush; the cache on disk is left as it was
+            logger.warning("Failed to persist job cache %s: %s", self.path, e)
 
 
 class NtfyNotifyPipeline:
@@ -67,8 +122,11 @@ class NtfyNotifyPipeline:
             spider.logger.debug("Dropping job %s (REMOTE_ONLY enabled)", item.get("job_page"))
             raise DropItem("Not remote-friendly")
 
-        job_hash = hashlib.sha256(f"{item['company']}{item['job_page']}".encode("utf-8")).hexdigest()
-        if self.cache.contains(job_hash):
+        job_hash = self._hash_job(item["company"], item["job_page"])
+        if self.cache.contains(job_hash) or (
+            self.cache.legacy
+            and self.cache.migrate(self._legacy_hash_job(item["company"], item["job_page"]), job_hash)
+        ):
             spider.logger.debug("Skipping duplicate job: %s", item["job_page"])
             raise DropItem("Duplicate job")
 
@@ -76,9 +134,22 @@ class NtfyNotifyPipeline:
         self.jobs.append(item)
         return item
 
+    @staticmethod
+    def _hash_job(company: str, url: str) -> str:
+        # Dedup key only, so a short non-cryptographic-strength digest is enough.
+        # The NUL separator keeps ("ab", "c") and ("a", "bc") distinct.
+        return hashlib.blake2b(f"{company}\0{url}".encode("utf-8"), digest_size=8).hexdigest()
+
+    @staticmethod
+    def _legacy_hash_job(company: str, url: str) -> str:
+        # Key format used before _hash_job; only needed to match old cache entries
+        return hashlib.sha256(f"{company}{url}".encode("utf-8")).hexdigest()
+
     def close_spider(self, spider):
         if not self.jobs:
             spider.logger.info("No HubSpot jobs found. Nothing to notify.")
+            # Still record legacy cache entries re-keyed during this crawl
+            self.cache.persist()
             return
 
         asyncio.run(self.send_notification(self.jobs, spider))
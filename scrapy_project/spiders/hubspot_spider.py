@@ -1,8 +1,9 @@
-import json
 import os
+import re
 from pathlib import Path
 from urllib.parse import parse_qs, urljoin, urlparse
 
+import orjson
 import scrapy
 
 CAREER_HINTS = [
@@ -135,6 +136,9 @@ ATS_JOB_URL_HINTS = [
     "vacancy",
 ]
 
+# Recruiting/staffing page markers, matched as substrings in one pass.
+AGENCY_RE = re.compile("agency|staffing|recruiting")
+
 DATASET_ENV_VAR = "DOMAINS_FILE"
 RENDER_SECRET_DATASET = Path("/etc/secrets/DOMAINS_FILE")
 
@@ -435,7 +439,7 @@ class HubspotSpider(scrapy.Spider):
 
     def _is_agency_page(self, text: str) -> bool:
         """Drop recruiting/staffing pages unless explicitly allowed."""
-        if "agency" in text or "staffing" in text or "recruiting" in text:
+        if AGENCY_RE.search(text):
             if os.getenv("ALLOW_AGENCIES"):
                 return False
             return True
@@ -462,9 +466,8 @@ class HubspotSpider(scrapy.Spider):
             return []
 
         try:
-            with dataset_path.open() as f:
-                data = json.load(f)
-        except json.JSONDecodeError as exc:
+            data = orjson.loads(dataset_path.read_bytes())
+        except orjson.JSONDecodeError as exc:
             self.logger.error("Invalid JSON in %s: %s", dataset_path, exc)
             return []
 
@@ -4,6 +4,7 @@ import logging
 import os
 import threading
 import subprocess
+import time
 from datetime import datetime
 from typing import Optional, List
 from urllib.parse import urlparse
@@ -14,6 +15,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
 from scraper_engine import JobScraper
+from state import put_drop_oldest
 
 # Configure logging
 logging.basicConfig(
@@ -32,6 +34,21 @@ CORS_ORIGINS = [origin.strip() for origin in cors_origins_env.split(",") if orig
 if not CORS_ORIGINS:
     CORS_ORIGINS = ["*"]  # Default to allow all if empty
 
+# Crawler output lines kept for /logs; oldest lines are dropped beyond this
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "5000"))
+
+# Formatted UTC timestamp and the monotonic time it was taken at
+_ts_cache = ["", 0.0]
+
+
+def _now_iso() -> str:
+    """UTC ISO timestamp, reused for up to 10 ms so busy log streams skip reformatting."""
+    now = time.monotonic()
+    if now - _ts_cache[1] >= 0.01:
+        _ts_cache[0] = datetime.utcnow().isoformat() + "Z"
+        _ts_cache[1] = now
+    return _ts_cache[0]
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -151,7 +168,7 @@ async def scrape_stream_endpoint(request: ScrapeRequest):
 @app.on_event("startup")
 async def startup_event():
     app.state.loop = asyncio.get_event_loop()
-    app.state.log_queue: asyncio.Queue[str] = asyncio.Queue()
+    app.state.log_queue: asyncio.Queue[str] = asyncio.Queue(maxsize=LOG_QUEUE_SIZE)
     app.state.proc: Optional[subprocess.Popen] = None
     app.state.run_id = 0
     app.state.started_at: Optional[str] = None
@@ -167,10 +184,10 @@ def _enqueue_output(
     assert proc.stdout is not None
     for raw_line in proc.stdout:
         line = raw_line.rstrip("\n")
-        state.last_event_at = datetime.utcnow().isoformat() + "Z"
-        asyncio.run_coroutine_threadsafe(queue.put(line), loop)
-    state.last_event_at = datetime.utcnow().isoformat() + "Z"
-    asyncio.run_coroutine_threadsafe(queue.put("[crawler] process ended"), loop)
+        state.last_event_at = _now_iso()
+        loop.call_soon_threadsafe(put_drop_oldest, queue, line)
+    state.last_event_at = _now_iso()
+    loop.call_soon_threadsafe(put_drop_oldest, queue, "[crawler] process ended")
 
 
 @app.post("/run")
@@ -183,7 +200,7 @@ async def trigger_run():
     while not queue.empty():
         queue.get_nowait()
 
-    app.state.started_at = datetime.utcnow().isoformat() + "Z"
+    app.state.started_at = _now_iso()
     app.state.last_event_at = None
 
     env = os.environ.copy()
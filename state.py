@@ -14,8 +14,9 @@ import logging
 import os
 from collections import deque
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 from uuid import uuid4
 
 from models import (
@@ -31,42 +32,130 @@ class EventBus:
     """
     Event bus for real-time event streaming via SSE.
     Implements a simple pub-sub pattern using asyncio queues.
+
+    Publishers only append to a pending buffer; a callback scheduled on the
+    subscribers' event loop fans the buffered events out, so publishing costs
+    the same no matter how many clients are connected.
+
+    publish_nowait() is thread-safe: called from a worker thread (e.g. a
+    logging handler firing inside asyncio.to_thread), the event is handed to
+    the subscribers' loop with call_soon_threadsafe, and it is dropped if no
+    loop is available to deliver it.
     """
     
-    def __init__(self):
+    def __init__(self, inbox_size: int = 4096):
+        # Set for O(1) subscribe/unsubscribe as SSE clients come and go; the
+        # fan-out iterates a tuple snapshot rebuilt only after membership
+        # changes, so it never copies the set per event
         self._subscribers: Set[asyncio.Queue] = set()
-    
-    def subscribe(self) -> asyncio.Queue:
-        """Subscribe to events. Returns a queue to receive events from."""
-        queue = asyncio.Queue(maxsize=1000)
+        self._snapshot: Optional[Tuple[asyncio.Queue, ...]] = ()
+        # Events waiting for fan-out; only touched on the event loop thread.
+        # Bounded, so the oldest are dropped if the loop falls far behind.
+        self._pending: deque = deque(maxlen=inbox_size)
+        # Loop the subscriber queues belong to, and the pending drain callback
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._drain_handle: Optional[asyncio.Handle] = None
+        self._drain_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def subscribe(self, maxsize: int = 1000) -> asyncio.Queue:
+        """
+        Subscribe to events. Returns a queue to receive events from.
+
+        The queue is bounded; if a subscriber falls behind, its oldest
+        undelivered events are dropped to make room for new ones.
+        """
+        queue = asyncio.Queue(maxsize=maxsize)
+        try:
+            self._loop = asyncio.get_running_loop()
+        except RuntimeError:
+            pass
         self._subscribers.add(queue)
+        self._snapshot = None
         logger.debug(f"New subscriber. Total subscribers: {len(self._subscribers)}")
         return queue
     
     def unsubscribe(self, queue: asyncio.Queue):
         """Unsubscribe from events."""
-        self._subscribers.discard(queue)
+        if queue in self._subscribers:
+            self._subscribers.discard(queue)
+            self._snapshot = None
         logger.debug(f"Subscriber removed. Total subscribers: {len(self._subscribers)}")
     
     async def publish(self, event):
         """Publish an event to all subscribers."""
+        self.publish_nowait(event)
+    
+    def publish_nowait(self, event):
+        """
+        Publish without awaiting, from the event loop or from any other thread.
+
+        Never raises for lack of a loop: off-loop events are forwarded to the
+        subscribers' loop, or dropped when there is none to deliver them.
+        """
         if not self._subscribers:
             return
-        
-        # Remove disconnected subscribers
-        dead_queues = set()
-        for queue in self._subscribers:
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        loop = self._loop
+        if running is not None and (loop is None or loop is running or loop.is_closed()):
+            self._loop = running
+            self._enqueue(event)
+        elif loop is not None and not loop.is_closed():
             try:
-                queue.put_nowait(event)
-            except asyncio.QueueFull:
-                logger.warning("Subscriber queue full, dropping event")
+                loop.call_soon_threadsafe(self._enqueue, event)
+            except RuntimeError:
+                # Loop closed between the check and the call
+                pass
+    
+    def _enqueue(self, event):
+        """Buffer an event and make sure a drain is scheduled (loop thread only)."""
+        self._pending.append(event)
+        loop = asyncio.get_running_loop()
+        if self._drain_handle is None or self._drain_loop is not loop:
+            self._drain_loop = loop
+            self._drain_handle = loop.call_soon(self._drain)
+    
+    def _drain(self):
+        """Fan the buffered events out to the subscribers."""
+        self._drain_handle = None
+        # Only what was buffered when the drain started; events published
+        # during fan-out (e.g. its own log records) get the next drain
+        for _ in range(len(self._pending)):
+            self._fan_out(self._pending.popleft())
+    
+    def _fan_out(self, event):
+        """Deliver one event to every subscriber."""
+        subscribers = self._snapshot
+        if subscribers is None:
+            subscribers = self._snapshot = tuple(self._subscribers)
+        dead_queues = None
+        for queue in subscribers:
+            try:
+                if queue.full():
+                    logger.debug("Subscriber queue full, dropping oldest event")
+                put_drop_oldest(queue, event)
             except Exception as e:
                 logger.error(f"Error publishing to subscriber: {e}")
+                if dead_queues is None:
+                    dead_queues = set()
                 dead_queues.add(queue)
         
         # Clean up dead queues
-        for queue in dead_queues:
-            self._subscribers.discard(queue)
+        if dead_queues:
+            self._subscribers.difference_update(dead_queues)
+            self._snapshot = None
+
+
+def put_drop_oldest(queue: asyncio.Queue, item):
+    """Put without blocking; when the queue is full, discard its oldest item first."""
+    try:
+        queue.put_nowait(item)
+    except asyncio.QueueFull:
+        queue.get_nowait()
+        queue.put_nowait(item)
 
 
 class LogsBuffer:
@@ -83,8 +172,14 @@ class LogsBuffer:
     
     def tail(self, limit: int = 500) -> List[LogLine]:
         """Get the most recent log lines."""
-        limit = min(limit, len(self._buffer))
-        return list(self._buffer)[-limit:] if limit > 0 else []
+        if limit <= 0:
+            return []
+        if limit >= len(self._buffer):
+            return list(self._buffer)
+        # Walk back from the newest entry instead of copying the whole buffer
+        tail = list(islice(reversed(self._buffer), limit))
+        tail.reverse()
+        return tail
     
     def clear(self):
         """Clear all log lines."""
@@ -108,10 +203,24 @@ class CrawlerState:
         self._domains_completed: int = 0
         self._jobs_found: int = 0
         self._errors_count: int = 0
+
+        # Last summary built and the field values it was built from; the
+        # dashboard polls summary() far more often than these change
+        self._summary: Optional[CrawlSummary] = None
+        self._summary_key: Optional[tuple] = None
         
         # Data storage
         self._jobs: List[JobItem] = []
         self._domains: List[DomainItem] = []
+
+        # Position indexes over the lists above. An index is rebuilt when its
+        # list was replaced or changed length, or when a hit no longer matches
+        # the list, so the lists may still be replaced or edited directly
+        self._job_positions: Dict[str, int] = {}
+        self._job_domain_positions: Dict[str, List[int]] = {}
+        self._jobs_indexed: tuple = (self._jobs, 0)
+        self._domain_positions: Dict[str, int] = {}
+        self._domains_indexed: tuple = (self._domains, 0)
         self._navigation_flows: Dict[str, List[NavigationFlowStep]] = {}
         self._screenshots: Dict[str, List[ScreenshotInfo]] = {}
         
@@ -129,17 +238,37 @@ class CrawlerState:
         return self._pause_requested
     
     def summary(self) -> CrawlSummary:
-        """Get current crawl summary."""
-        return CrawlSummary(
-            state=self._state,
-            paused=self._pause_requested,
-            last_run_started_at=self._last_run_started_at,
-            last_run_finished_at=self._last_run_finished_at,
-            domains_total=self._domains_total,
-            domains_completed=self._domains_completed,
-            jobs_found=self._jobs_found,
-            errors_count=self._errors_count
+        """
+        Get current crawl summary.
+
+        The model is rebuilt only when one of its fields changed, so treat
+        the returned object as read-only.
+        """
+        key = (
+            self._state,
+            self._pause_requested,
+            self._last_run_started_at,
+            self._last_run_finished_at,
+            self._domains_total,
+            self._domains_completed,
+            self._jobs_found,
+            self._errors_count,
         )
+        if key != self._summary_key:
+            (state, paused, started_at, finished_at,
+             domains_total, domains_completed, jobs_found, errors_count) = key
+            self._summary = CrawlSummary(
+                state=state,
+                paused=paused,
+                last_run_started_at=started_at,
+                last_run_finished_at=finished_at,
+                domains_total=domains_total,
+                domains_completed=domains_completed,
+                jobs_found=jobs_found,
+                errors_count=errors_count
+            )
+            self._summary_key = key
+        return self._summary
     
     def request_stop(self):
         """Request the crawler to stop."""
@@ -179,16 +308,87 @@ class CrawlerState:
             self._state = "error"
         logger.info(f"Crawl run finished. State: {self._state}")
     
+    def _reindex_jobs(self):
+        """Rebuild the job-id and job-domain position indexes."""
+        self._job_positions = {}
+        self._job_domain_positions = {}
+        for pos, job in enumerate(self._jobs):
+            self._job_positions.setdefault(job.id, pos)
+            self._job_domain_positions.setdefault(job.domain, []).append(pos)
+        self._jobs_indexed = (self._jobs, len(self._jobs))
+
+    def _jobs_index_current(self) -> bool:
+        """Whether the job indexes were built for the current list at its current length."""
+        indexed, size = self._jobs_indexed
+        return indexed is self._jobs and size == len(self._jobs)
+
+    def _reindex_domains(self):
+        """Rebuild the domain-name position index."""
+        self._domain_positions = {}
+        for pos, item in enumerate(self._domains):
+            self._domain_positions.setdefault(item.domain, pos)
+        self._domains_indexed = (self._domains, len(self._domains))
+
+    def _domains_index_current(self) -> bool:
+        """Whether the domain index was built for the current list at its current length."""
+        indexed, size = self._domains_indexed
+        return indexed is self._domains and size == len(self._domains)
+
+    def _job_position(self, job_id: str) -> Optional[int]:
+        """
+        Return the list position of a job, rebuilding the index if it is stale.
+
+        A miss against an index that is current is trusted without a rebuild;
+        a hit is checked against the list, so jobs replaced in place are
+        picked up once one of their old positions is looked up.
+        """
+        if not self._jobs_index_current():
+            self._reindex_jobs()
+            return self._job_positions.get(job_id)
+        pos = self._job_positions.get(job_id)
+        if pos is None or self._jobs[pos].id == job_id:
+            return pos
+        self._reindex_jobs()
+        return self._job_positions.get(job_id)
+
+    def _domain_position(self, domain: str) -> Optional[int]:
+        """Return the list position of a domain, rebuilding the index if it is stale (as _job_position)."""
+        if not self._domains_index_current():
+            self._reindex_domains()
+            return self._domain_positions.get(domain)
+        pos = self._domain_positions.get(domain)
+        if pos is None or self._domains[pos].domain == domain:
+            return pos
+        self._reindex_domains()
+        return self._domain_positions.get(domain)
+
     def add_job(self, job: JobItem):
         """Add a job to the results."""
+        if not self._jobs_index_current():
+            self._reindex_jobs()
+        pos = len(self._jobs)
         self._jobs.append(job)
+        self._job_positions.setdefault(job.id, pos)
+        self._job_domain_positions.setdefault(job.domain, []).append(pos)
+        self._jobs_indexed = (self._jobs, len(self._jobs))
         self._jobs_found = len(self._jobs)
     
     def add_domain(self, domain: DomainItem):
-        """Add or update a domain."""
-        # Remove existing domain with same name if present
-        self._domains = [d for d in self._domains if d.domain != domain.domain]
-        self._domains.append(domain)
+        """Add or update a domain; the most recently updated domain is listed last."""
+        domains = self._domains
+        pos = self._domain_position(domain.domain)
+        if pos is None:
+            self._domain_positions[domain.domain] = len(domains)
+            domains.append(domain)
+            self._domains_indexed = (domains, len(domains))
+        elif pos == len(domains) - 1:
+            domains[pos] = domain
+        else:
+            # Move it to the end, then shift the positions of those after it
+            del domains[pos]
+            domains.append(domain)
+            for i in range(pos, len(domains)):
+                self._domain_positions[domains[i].domain] = i
     
     def increment_completed(self):
         """Increment the completed domains counter."""
@@ -205,7 +405,11 @@ class CrawlerState:
         remote_only: bool = False
     ) -> List[JobItem]:
         """Query jobs with filters."""
-        results = self._jobs
+        if domain:
+            # Jobs for one domain come from the index, in insertion order
+            results = self._jobs_for_domain(domain)
+        else:
+            results = self._jobs
         
         if q:
             q_lower = q.lower()
@@ -214,20 +418,28 @@ class CrawlerState:
                 if q_lower in job.title.lower() or q_lower in job.domain.lower()
             ]
         
-        if domain:
-            results = [job for job in results if job.domain == domain]
-        
         if remote_only:
             results = [job for job in results if job.remote_type == "remote"]
         
         return results
     
+    def _jobs_for_domain(self, domain: str) -> List[JobItem]:
+        """Return the jobs for one domain, rebuilding the index if it is stale (as _job_position)."""
+        if self._jobs_index_current():
+            jobs = self._jobs
+            positions = self._job_domain_positions.get(domain)
+            if positions is None:
+                return []
+            results = [jobs[pos] for pos in positions]
+            if all(job.domain == domain for job in results):
+                return results
+        self._reindex_jobs()
+        return [self._jobs[pos] for pos in self._job_domain_positions.get(domain, ())]
+
     def get_job(self, job_id: str) -> Optional[JobItem]:
         """Get a specific job by ID."""
-        for job in self._jobs:
-            if job.id == job_id:
-                return job
-        return None
+        pos = self._job_position(job_id)
+        return self._jobs[pos] if pos is not None else None
     
     def list_domains(self) -> List[DomainItem]:
         """List all domains."""
@@ -235,10 +447,8 @@ class CrawlerState:
     
     def get_domain(self, domain: str) -> Optional[DomainItem]:
         """Get a specific domain."""
-        for d in self._domains:
-            if d.domain == domain:
-                return d
-        return None
+        pos = self._domain_position(domain)
+        return self._domains[pos] if pos is not None else None
     
     def get_navigation_flow(self, domain: str) -> List[NavigationFlowStep]:
         """Get the navigation flow for a domain."""
@@ -292,8 +502,10 @@ class ConfigState:
     def _save(self):
         """Save configuration to file."""
         try:
-            with open(self.config_file, 'w') as f:
+            tmp_file = self.config_file.with_name(self.config_file.name + '.tmp')
+            with open(tmp_file, 'w') as f:
                 json.dump(self._config.model_dump(), f, indent=2)
+            tmp_file.replace(self.config_file)
             logger.info(f"Configuration saved to {self.config_file}")
         except Exception as e:
             logger.error(f"Failed to save config: {e}")
@@ -11,6 +11,9 @@ def get_supabase_client() -> Optional[Client]:
     """
     Returns a Supabase client if SUPABASE_URL and SUPABASE_KEY are set.
     If not set, returns None so the scraper can keep running without DB.
+
+    Only a created client is cached; while credentials are missing each
+    call re-checks the environment, so setting them later takes effect.
     """
     global _SUPABASE_CLIENT
 
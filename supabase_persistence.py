@@ -152,7 +152,7 @@ def save_jobs_for_domain(
     # Compute default timestamp once for consistency across batch
     default_scraped_at = datetime.utcnow().isoformat()
 
-    jobs_inserted = 0
+    rows = []
     for job in jobs:
         # Extract guaranteed fields from job dict
         job_title = job.get("job_title") or job.get("title") or ""
@@ -183,7 +183,7 @@ def save_jobs_for_domain(
             job_hash = _compute_job_hash(company_id, job_title, job_url)
 
         # Build insert data with all required fields
-        insert_data = {
+        rows.append({
             "company_id": company_id,
             "run_id": run_id,
             "job_title": job_title,
@@ -197,8 +197,46 @@ def save_jobs_for_domain(
             "hash": job_hash,
             "active": active,
             "ats_provider": ats_provider,
-        }
-        
+        })
+
+    if not rows:
+        return
+
+    # Insert the domain's jobs in one request. If it is rejected, fall back
+    # to one insert per job so a single bad row doesn't lose the others.
+    try:
+        resp = client.table("jobs").insert(rows).execute()
+        inserted = resp.data or []
+    except Exception as e:
+        logger.warning(f"Bulk insert of {len(rows)} jobs failed, inserting one at a time: {e}")
+        jobs_inserted = _insert_jobs_one_by_one(client, jobs, rows)
+    else:
+        # Inserted rows come back in the order they were sent
+        jobs_inserted = 0
+        metadata_rows = []
+        for job, row in zip(jobs, inserted):
+            job_id = row.get("id")
+            if job_id:
+                jobs_inserted += 1
+                metadata = _job_metadata_row(job_id, job)
+                if metadata:
+                    metadata_rows.append(metadata)
+        _save_job_metadata_rows(client, metadata_rows)
+
+    # Log insertion summary as per requirements
+    if jobs_inserted > 0:
+        logger.info(f"Saved {jobs_inserted} jobs for run_id={run_id}, company_id={company_id}")
+
+
+def _insert_jobs_one_by_one(client: Client, jobs: List[Dict], rows: List[Dict]) -> int:
+    """
+    Insert job rows one request at a time, with their metadata.
+
+    Returns:
+        Number of jobs inserted
+    """
+    jobs_inserted = 0
+    for job, insert_data in zip(jobs, rows):
         try:
             resp = client.table("jobs").insert(insert_data).execute()
             job_id = resp.data[0]["id"] if resp.data else None
@@ -206,18 +244,17 @@ def save_jobs_for_domain(
             if job_id:
                 jobs_inserted += 1
                 # Insert job_metadata if present
-                _save_job_metadata(client, job_id, job)
+                metadata = _job_metadata_row(job_id, job)
+                if metadata:
+                    client.table("job_metadata").insert(metadata).execute()
         except Exception as e:
             logger.error(f"Failed to insert job: {e}")
-    
-    # Log insertion summary as per requirements
-    if jobs_inserted > 0:
-        logger.info(f"Saved {jobs_inserted} jobs for run_id={run_id}, company_id={company_id}")
+    return jobs_inserted
 
 
-def _save_job_metadata(client: Client, job_id: str, job: Dict) -> None:
+def _job_metadata_row(job_id: str, job: Dict) -> Optional[Dict]:
     """
-    Save optional metadata into job_metadata if available on the job object.
+    Build the job_metadata row for a job, or None if it has no metadata.
     """
     seniority = job.get("seniority")
     employment_type = job.get("employment_type")
@@ -227,9 +264,9 @@ def _save_job_metadata(client: Client, job_id: str, job: Dict) -> None:
     raw_json = job.get("raw_json")
 
     if not any([seniority, employment_type, salary_min, salary_max, technologies, raw_json]):
-        return
+        return None
 
-    insert_data = {
+    return {
         "job_id": job_id,
         "seniority": seniority,
         "employment_type": employment_type,
@@ -239,7 +276,25 @@ def _save_job_metadata(client: Client, job_id: str, job: Dict) -> None:
         "raw_json": raw_json,
     }
 
-    client.table("job_metadata").insert(insert_data).execute()
+
+def _save_job_metadata_rows(client: Client, metadata_rows: List[Dict]) -> None:
+    """
+    Save job_metadata rows in one request, or one at a time if that fails.
+    """
+    if not metadata_rows:
+        return
+
+    try:
+        client.table("job_metadata").insert(metadata_rows).execute()
+        return
+    except Exception as e:
+        logger.warning(f"Bulk insert of {len(metadata_rows)} job metadata rows failed, inserting one at a time: {e}")
+
+    for metadata in metadata_rows:
+        try:
+            client.table("job_metadata").insert(metadata).execute()
+        except Exception as e:
+            logger.error(f"Failed to insert job metadata: {e}")
 
 
 def get_jobs_for_run(run_id: str) -> List[Dict]:
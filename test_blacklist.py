@@ -158,6 +158,22 @@ class TestDomainBlacklist(unittest.TestCase):
                     f"Expected subdomain {url} to be blacklisted"
                 )
     
+    def test_lookalike_domains_not_blacklisted(self):
+        """Only whole-label matches count; a domain merely ending in a blacklisted name is allowed."""
+        lookalike_urls = [
+            "https://notfacebook.com/",
+            "https://facebook.com.example.org/",
+            "https://myhubspot.agency/",
+            "https://deep.sub.acme-linkedin.com/jobs",
+        ]
+
+        for url in lookalike_urls:
+            with self.subTest(url=url):
+                self.assertFalse(
+                    self.blacklist.is_blacklisted_domain(url),
+                    f"Expected {url} not to be blacklisted"
+                )
+
     def test_www_prefix_handling(self):
         """Test that www. prefix is handled correctly."""
         urls_with_www = [
@@ -16,7 +16,7 @@ from pathlib import Path
 
 import pytest
 
-from scraper_engine import JobScraper, scrape_all_domains
+from scraper_engine import JobScraper, _normalize_url, _run_extraction_layers, scrape_all_domains
 
 
 @pytest.mark.asyncio
@@ -208,5 +208,265 @@ def test_batch_remainder_handling():
     assert 'batch_start + 1' in source, "Should use 1-indexed batch start for logging"
 
 
+def test_batch_domains_scraped_concurrently(tmp_path, monkeypatch):
+    """Domains in a batch overlap up to SCRAPE_CONCURRENCY, each in its own context."""
+    import scraper_engine
+
+    class FakeContext:
+        def __init__(self, log):
+            self.log = log
+
+        async def new_page(self):
+            return FakePage()
+
+        async def route(self, pattern, handler):
+            self.log.append("context routed")
+
+        async def close(self):
+            self.log.append("context closed")
+
+    class FakePage:
+        async def close(self):
+            pass
+
+    class FakeBrowser:
+        def __init__(self, log):
+            self.log = log
+
+        async def new_context(self):
+            return FakeContext(self.log)
+
+    class FakeScraper:
+        log = []
+        active = 0
+        peak = 0
+
+        def __init__(self):
+            self.browser = None
+
+        async def initialize(self):
+            self.browser = FakeBrowser(self.log)
+
+        async def shutdown(self, keep_driver=False):
+            self.browser = None
+
+        block_heavy_resources = JobScraper.block_heavy_resources
+
+        async def scrape_domain(self, domain_url, company_name, page=None, run_id=None):
+            cls = type(self)
+            cls.active += 1
+            cls.peak = max(cls.peak, cls.active)
+            await asyncio.sleep(0.01)
+            cls.active -= 1
+            if "fail" in domain_url:
+                raise RuntimeError("boom")
+            return [{"url": domain_url}]
+
+    monkeypatch.setattr(scraper_engine, "JobScraper", FakeScraper)
+    monkeypatch.setattr(scraper_engine, "SCRAPE_CONCURRENCY", 2)
+    monkeypatch.setattr(scraper_engine, "create_scrape_run", lambda: None)
+
+    domains_file = tmp_path / "domains.json"
+    domains_file.write_text(json.dumps([f"https://site{i}.com" for i in range(6)] + ["https://fail.com"]))
+
+    progress = []
+
+    async def on_progress(done, total, jobs, all_jobs):
+        progress.append((done, total))
+
+    jobs, run_id = asyncio.run(scrape_all_domains(str(domains_file), progress_callback=on_progress))
+
+    assert run_id is None
+    assert sorted(job["url"] for job in jobs) == [f"https://site{i}.com" for i in range(6)]
+    assert FakeScraper.peak == 2
+    assert FakeScraper.log.count("context closed") == 7
+    assert FakeScraper.log.count("context routed") == 7
+    assert [done for done, _ in progress] == list(range(1, 8))
+    assert all(total == 7 for _, total in progress)
+
+
+class FakeRoute:
+    """Playwright route stand-in recording whether it was aborted or continued."""
+
+    def __init__(self, resource_type, url="https://acme.com/careers"):
+        self.request = type("Request", (), {"resource_type": resource_type, "url": url})()
+        self.outcome = None
+
+    async def abort(self):
+        self.outcome = "aborted"
+
+    async def continue_(self):
+        self.outcome = "continued"
+
+
+def test_heavy_resources_are_aborted():
+    """Images, media, fonts and stylesheets are aborted; documents and scripts go through."""
+    from scraper_engine import _route_without_heavy_resources
+
+    async def outcomes():
+        results = {}
+        for resource_type in ("image", "media", "font", "stylesheet", "document", "script", "xhr"):
+            route = FakeRoute(resource_type)
+            await _route_without_heavy_resources(route)
+            results[resource_type] = route.outcome
+        return results
+
+    assert asyncio.run(outcomes()) == {
+        "image": "aborted",
+        "media": "aborted",
+        "font": "aborted",
+        "stylesheet": "aborted",
+        "document": "continued",
+        "script": "continued",
+        "xhr": "continued",
+    }
+
+
+def test_tracker_requests_are_aborted():
+    """Scripts and beacons from analytics hosts are aborted; the site's own are not."""
+    from scraper_engine import _route_without_heavy_resources
+
+    async def outcome(url):
+        route = FakeRoute("script", url)
+        await _route_without_heavy_resources(route)
+        return route.outcome
+
+    assert asyncio.run(outcome("https://www.googletagmanager.com/gtm.js?id=GTM-1")) == "aborted"
+    assert asyncio.run(outcome("https://js.hs-analytics.net/analytics/123.js")) == "aborted"
+    assert asyncio.run(outcome("https://acme.com/assets/jobs.js")) == "continued"
+    assert asyncio.run(outcome("https://boards.greenhouse.io/embed/job_board/js")) == "continued"
+    assert asyncio.run(outcome("https://notgoogletagmanager.com/app.js")) == "continued"
+
+
+def crawl_fake_site(monkeypatch, links, career_url, setup=None):
+    """
+    Run scrape_domain over a fake site; returns (jobs, URLs visited in order).
+
+    setup, if given, is called with the scraper before the crawl to patch it further.
+    """
+
+    class FakePage:
+        def __init__(self):
+            self.visited = []
+            self.url = None
+
+        async def goto(self, url, **kwargs):
+            self.visited.append(url)
+            self.url = url
+
+        async def wait_for_load_state(self, *args, **kwargs):
+            pass
+
+        async def content(self):
+            return self.url
+
+    scraper = JobScraper()
+    monkeypatch.setattr(scraper.rate_limiter, "get_delay", lambda domain: 0)
+    # Ignore any job tracking cache left in the working directory
+    monkeypatch.setattr(
+        scraper.incremental_tracker, "get_changes",
+        lambda company: {"new": [], "removed": [], "updated": []},
+    )
+
+    async def can_crawl(url):
+        return True
+
+    async def extract(html, page_url, company_name, jobs_list):
+        jobs_list.append({"url": page_url})
+
+    monkeypatch.setattr(scraper.robots_checker, "can_crawl", can_crawl)
+    monkeypatch.setattr(scraper.career_detector, "is_career_page", lambda url, html: url == career_url)
+    monkeypatch.setattr(scraper.career_detector, "get_career_links", lambda html, url: links.get(url, []))
+    monkeypatch.setattr(scraper, "_extract_jobs_from_page", extract)
+    if setup:
+        setup(scraper)
+
+    page = FakePage()
+    jobs = asyncio.run(scraper.scrape_domain("https://acme.com", "Acme", page=page))
+    return jobs, page.visited
+
+
+def test_scrape_domain_crawls_breadth_first(monkeypatch):
+    """Career links one hop from the homepage are all tried before deeper ones."""
+    links = {
+        "https://acme.com": ["https://acme.com/about", "https://acme.com/work-with-us"],
+        "https://acme.com/about": ["https://acme.com/about/team"],
+    }
+    jobs, visited = crawl_fake_site(monkeypatch, links, "https://acme.com/work-with-us")
+
+    assert jobs == [{"url": "https://acme.com/work-with-us"}]
+    # /about/team is two hops away, so the crawl stops before reaching it
+    assert visited == [
+        "https://acme.com",
+        "https://acme.com/about",
+        "https://acme.com/work-with-us",
+    ]
+
+
+def test_scrape_domain_tries_career_urls_first(monkeypatch):
+    """Links whose URL looks like a careers page are crawled ahead of the rest."""
+    links = {
+        "https://acme.com": ["https://acme.com/about", "https://acme.com/company"],
+        "https://acme.com/about": ["https://acme.com/about/jobs"],
+    }
+    jobs, visited = crawl_fake_site(monkeypatch, links, "https://acme.com/about/jobs")
+
+    assert jobs == [{"url": "https://acme.com/about/jobs"}]
+    # /about/jobs is two hops away but jumps ahead of /company
+    assert visited == [
+        "https://acme.com",
+        "https://acme.com/about",
+        "https://acme.com/about/jobs",
+    ]
+
+
+def test_scrape_domain_fetches_linked_ats_board_without_loading_it(monkeypatch):
+    """A link to a hosted ATS board goes straight to the ATS API."""
+    links = {"https://acme.com": ["https://boards.greenhouse.io/acme"]}
+    tokens = []
+
+    async def fetch_greenhouse_jobs(board_token):
+        tokens.append(board_token)
+        return [{"title": "HubSpot Developer", "url": "https://boards.greenhouse.io/acme/jobs/1"}]
+
+    def setup(scraper):
+        monkeypatch.setattr(scraper.ats_fetcher, "fetch_greenhouse_jobs", fetch_greenhouse_jobs)
+        monkeypatch.setattr(scraper.incremental_tracker, "add_job", lambda company, job: None)
+
+    jobs, visited = crawl_fake_site(monkeypatch, links, None, setup)
+
+    assert tokens == ["acme"]
+    assert [job["url"] for job in jobs] == ["https://boards.greenhouse.io/acme/jobs/1"]
+    assert jobs[0]["extraction_source"] == "ats_greenhouse"
+    assert visited == ["https://acme.com"]
+
+
+def test_extraction_layers_do_not_repeat_json_ld_jobs():
+    """JSON-LD jobs found by layer 1 are not extracted again by layer 5."""
+    html = """<html><head><script type="application/ld+json">
+    {"@type": "JobPosting", "title": "HubSpot Developer", "url": "https://acme.com/jobs/1"}
+    </script></head><body><p>Careers</p></body></html>"""
+    jobs, outcomes, page_text = _run_extraction_layers(html, "https://acme.com/careers")
+
+    assert page_text == "Careers"
+    assert dict(outcomes)["json_ld"] == 1
+    assert [job["title"] for job in jobs].count("HubSpot Developer") == 1
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("https://acme.com/careers?team=eng#open", "https://acme.com/careers?team=eng"),
+    ("https://acme.com?", "https://acme.com"),
+    ("http://user@acme.com:8080", "http://user@acme.com:8080"),
+    ("https://acme.com/jobs;jsessionid=1", "https://acme.com/jobs"),
+    ("https://[::1]/jobs", "https://[::1]/jobs"),
+    ("https://[::1/jobs", None),
+    ("/careers", None),
+    ("mailto:jobs@acme.com", None),
+])
+def test_normalize_url(url, expected):
+    """URLs lose their fragment; path parameters and malformed hosts go through urlparse."""
+    assert _normalize_url.__wrapped__(url) == expected
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,53 @@
+"""
+Tests for cross-layer job deduplication.
+
+Covers the exact-hash, same-URL and fuzzy title/location matches made by
+JobDeduplicator.is_duplicate.
+"""
+
+from deduplication import JobDeduplicator
+
+
+def make_job(title, url="", location=""):
+    """Build a minimal extracted job dict."""
+    return {"title": title, "url": url, "location": location, "summary": ""}
+
+
+def test_exact_repeat_is_duplicate():
+    """The same job seen twice is a duplicate the second time."""
+    dedup = JobDeduplicator()
+    assert not dedup.is_duplicate(make_job("HubSpot Developer", "https://acme.com/jobs/1"))
+    assert dedup.is_duplicate(make_job("HubSpot Developer", "https://acme.com/jobs/1"))
+
+
+def test_same_url_is_duplicate_whatever_the_title():
+    """Fuzzy matching treats a job at an already-seen URL as a duplicate."""
+    dedup = JobDeduplicator()
+    assert not dedup.is_duplicate(make_job("HubSpot Developer", "https://acme.com/jobs/1"))
+    assert dedup.is_duplicate(make_job("Apply now", "https://acme.com/jobs/1"))
+    assert not dedup.is_duplicate(make_job("Apply now", "https://acme.com/jobs/1"), use_fuzzy=False)
+
+
+def test_similar_titles_match_on_location():
+    """Near-identical titles match when their locations are also similar."""
+    dedup = JobDeduplicator()
+    assert not dedup.is_duplicate(make_job("Senior HubSpot Developer", location="Boston, MA"))
+    assert dedup.is_duplicate(make_job("Senior HubSpot Developers", location="Boston MA"))
+    assert not dedup.is_duplicate(make_job("Senior HubSpot Developers", location="Remote"))
+    assert not dedup.is_duplicate(make_job("Marketing Operations Lead", location="Boston, MA"))
+
+
+def test_title_only_match_needs_higher_similarity():
+    """Without locations, titles must be almost identical to match."""
+    dedup = JobDeduplicator()
+    assert not dedup.is_duplicate(make_job("Senior HubSpot Developer"))
+    assert dedup.is_duplicate(make_job("Senior HubSpot Developer!"))
+    assert not dedup.is_duplicate(make_job("Senior HubSpot Dev"))
+
+
+def test_clear_forgets_seen_jobs():
+    """After clear, previously seen jobs are new again."""
+    dedup = JobDeduplicator()
+    dedup.is_duplicate(make_job("HubSpot Developer", "https://acme.com/jobs/1"))
+    dedup.clear()
+    assert not dedup.is_duplicate(make_job("Other title", "https://acme.com/jobs/1"))
@@ -0,0 +1,53 @@
+"""
+Tests for the extraction utilities.
+
+Covers NoJobsDetector's message, placeholder and empty-structure checks
+and ExtractionReporter's HTML archive.
+"""
+
+import gzip
+import json
+
+import pytest
+
+from extraction_utils import ExtractionReporter, NoJobsDetector
+
+
+@pytest.mark.parametrize("html", [
+    "<html><body><p>There are no open positions right now.</p></body></html>",
+    "<html><body><h2>No Open <em>Positions</em></h2></body></html>",
+    "<html><body><p>Careers page coming soon</p></body></html>",
+    '<html><body><ul class="jobs no-jobs"></ul></body></html>',
+    '<html><body><div id="no-openings"></div></body></html>',
+    "<html><body><span>0 jobs</span></body></html>",
+    "<html><body><!--0 openings--></body></html>",
+])
+def test_has_no_jobs_detects_empty_pages(html):
+    """Empty-listing messages and markers are detected."""
+    assert NoJobsDetector().has_no_jobs(html)
+
+
+@pytest.mark.parametrize("html", [
+    "<html><body><h2>Open Positions</h2><a href='/jobs/1'>HubSpot Developer</a></body></html>",
+    "<html><body><p>no open</p><p>positions</p></body></html>",
+    "<html><body><script>var msg = 'coming soon';</script><p>We're hiring</p></body></html>",
+    '<html><body><ul class="no-jobs-banner"></ul></body></html>',
+    "<html><body><span>10 jobs</span></body></html>",
+    "",
+])
+def test_has_no_jobs_ignores_pages_with_jobs(html):
+    """Pages with listings, script text or near-miss markers are not flagged."""
+    assert not NoJobsDetector().has_no_jobs(html)
+
+
+def test_archive_html_writes_gzip_with_metadata(tmp_path):
+    """Archived pages are gzip-compressed, with a metadata file beside them."""
+    html = "<html><body><h1>Careers</h1></body></html>"
+    ExtractionReporter(archive_dir=tmp_path).archive_html("https://acme.com/careers", html, success=True, jobs_found=2)
+
+    (archive,) = tmp_path.glob("*.html.gz")
+    with gzip.open(archive, "rt", encoding="utf-8") as f:
+        assert f.read() == html
+    meta = json.loads((tmp_path / f"{archive.name}.meta.json").read_text())
+    assert meta["url"] == "https://acme.com/careers"
+    assert meta["jobs_found"] == 2
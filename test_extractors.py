@@ -5,6 +5,11 @@ Tests the multi-layer extractors with sample HTML.
 """
 
 import unittest
+from unittest import mock
+
+from bs4 import BeautifulSoup
+
+import extractors
 from extractors import (
     JsonLdExtractor,
     AnchorExtractor,
@@ -247,6 +252,29 @@ class TestMultiLayerExtractor(unittest.TestCase):
         # Should find jobs from multiple sources
         self.assertGreaterEqual(len(jobs), 2)
 
+    def test_extract_all_parses_page_once(self):
+        """All layers share one parse and find the same jobs as parsing separately."""
+        html = '''
+        <html>
+        <body>
+            <a href="/job/anchor">Anchor Developer</a>
+            <h2>Open Positions</h2>
+            <div class="job-card">
+                <h3>Section Engineer</h3>
+            </div>
+        </body>
+        </html>
+        '''
+        separate = []
+        for extractor in MultiLayerExtractor("https://example.com/careers").extractors:
+            separate.extend(extractor.extract(html))
+
+        with mock.patch.object(extractors, "BeautifulSoup", wraps=BeautifulSoup) as parse:
+            shared = self.extractor.extract_all(html)
+        self.assertEqual(parse.call_count, 1)
+        self.assertTrue(shared)
+        self.assertEqual(shared, separate)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,87 @@
+"""
+Tests for loading the domains file.
+
+Covers de-duplication of repeated sites, which title is kept, and the
+mtime-keyed parse cache.
+"""
+
+import json
+import os
+
+from scraper_engine import load_domains
+
+
+def write_domains(path, entries, mtime_ns=None):
+    """Write a domains file, optionally pinning its modification time."""
+    path.write_text(json.dumps(entries))
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_load_domains_skips_scheme_www_case_and_slash_variants(tmp_path):
+    """The same site listed with a different scheme, www., case or slash is loaded once."""
+    path = tmp_path / "domains.json"
+    write_domains(path, [
+        "https://acme.com",
+        "http://acme.com",
+        "https://www.acme.com",
+        "HTTPS://ACME.com",
+        "https://acme.com/",
+        "https://globex.com",
+    ])
+
+    domains = load_domains(str(path))
+    assert [d["website"] for d in domains] == ["https://acme.com", "https://globex.com"]
+
+
+def test_load_domains_first_title_wins(tmp_path):
+    """When a site repeats, the first entry's website and title are kept."""
+    path = tmp_path / "domains.json"
+    write_domains(path, [
+        {"website": "https://www.acme.com/", "title": "Acme Corp"},
+        {"website": "https://acme.com", "title": "Acme (duplicate)"},
+        {"url": "https://globex.com"},
+        "",
+        None,
+    ])
+
+    domains = load_domains(str(path))
+    assert domains == [
+        {"website": "https://www.acme.com/", "title": "Acme Corp"},
+        {"website": "https://globex.com", "title": "https://globex.com"},
+    ]
+
+
+def test_load_domains_rereads_rewritten_file(tmp_path):
+    """Rewriting the file invalidates the cached parse."""
+    path = tmp_path / "domains.json"
+    write_domains(path, ["https://acme.com"], mtime_ns=1_000_000_000)
+    assert [d["website"] for d in load_domains(str(path))] == ["https://acme.com"]
+
+    write_domains(path, ["https://globex.com", "https://initech.com"], mtime_ns=2_000_000_000)
+    assert [d["website"] for d in load_domains(str(path))] == [
+        "https://globex.com",
+        "https://initech.com",
+    ]
+
+
+def test_load_domains_returns_fresh_dicts(tmp_path):
+    """Callers may mutate the returned dicts without affecting later loads."""
+    path = tmp_path / "domains.json"
+    write_domains(path, ["https://acme.com"])
+
+    first = load_domains(str(path))
+    first[0]["title"] = "changed"
+    assert load_domains(str(path))[0]["title"] == "https://acme.com"
+
+
+def test_load_domains_missing_or_invalid_file(tmp_path):
+    """A missing file, invalid JSON or a non-array document loads as empty."""
+    assert load_domains(str(tmp_path / "missing.json")) == []
+
+    path = tmp_path / "domains.json"
+    path.write_text("{not json")
+    assert load_domains(str(path)) == []
+
+    write_domains(path, {"website": "https://acme.com"}, mtime_ns=3_000_000_000)
+    assert load_domains(str(path)) == []
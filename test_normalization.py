@@ -0,0 +1,61 @@
+"""
+Tests for HTML-to-text conversion used for page classification and for
+JobNormalizer field normalization.
+"""
+
+import pytest
+from bs4 import BeautifulSoup
+
+from normalization import JobNormalizer, html_to_text
+
+
+@pytest.mark.parametrize("html", [
+    "",
+    "plain text, no markup",
+    "<p>a<!-- comment -->b</p>",
+    "<html><head><title>Careers</title><style>.x{}</style><script>var x = 1;</script></head>"
+    "<body><template>hidden</template><p>Hello&nbsp;<b>World</b> &amp; co</p>tail<br>more</body></html>",
+    "<div>unclosed <span>nested<div>deep</p></table>",
+    "<?xml version='1.0' encoding='utf-8'?><html><body><p>declared</p></body></html>",
+    "<ul><li> Remote </li><li>\n\tHybrid\n</li></ul>",
+])
+def test_html_to_text_matches_beautifulsoup(html):
+    """html_to_text gives the same text as BeautifulSoup's get_text(' ', strip=True)."""
+    expected = BeautifulSoup(html, 'lxml').get_text(separator=' ', strip=True)
+    assert html_to_text(html) == expected
+
+
+def test_html_to_text_skips_scripts_and_keeps_following_text():
+    """Script bodies are dropped, the text after them is kept as its own string."""
+    assert html_to_text("<p>before<script>alert(1)</script>after</p>") == "before after"
+
+
+def test_normalize_summary_strips_html():
+    """Summaries are reduced to their text before whitespace cleanup."""
+    normalizer = JobNormalizer()
+    assert normalizer.normalize_summary("<p>Build <b>HubSpot</b> themes</p>") == "Build HubSpot themes"
+
+
+@pytest.mark.parametrize("text, context", [
+    ("HubSpot Developer", ""),
+    ("HubSpot Developer", "Apply today. This is a contract role."),
+    ("Marketing Intern", "Full-time benefits for all staff."),
+    ("Developer full", "time role"),
+    ("Developer", "interns" + " welcome" * 10),
+    ("Developer", "contractpart timeftxx-internships"),
+    ("", "Part time position"),
+])
+def test_employment_type_with_context_matches_joined_text(text, context):
+    """Passing the page text as context gives the same answer as joining it on."""
+    normalizer = JobNormalizer()
+    joined = f"{text} {context}" if context else text
+    assert normalizer.normalize_employment_type(text, context) == normalizer.normalize_employment_type(joined)
+
+
+def test_employment_type_context_scanned_once_per_page():
+    """Jobs sharing a page reuse its scan, and a new page is scanned afresh."""
+    normalizer = JobNormalizer()
+    page = "Join us. " * 50 + "This is a contract position."
+    assert normalizer.normalize_employment_type("Developer", page) == "contract"
+    assert normalizer.normalize_employment_type("Part-time Designer", page) == "part_time"
+    assert normalizer.normalize_employment_type("Developer", "Join us. " * 50) == "full_time"
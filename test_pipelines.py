@@ -0,0 +1,151 @@
+"""
+Tests for the Scrapy notification pipeline's seen-job cache.
+
+Covers the newline-delimited cache log and migration from the legacy
+JSON-list format.
+"""
+
+import hashlib
+import json
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("scrapy")
+
+from scrapy.exceptions import DropItem
+
+from scrapy_project import pipelines
+from scrapy_project.pipelines import JobCache, NtfyNotifyPipeline
+
+
+def test_job_cache_missing_file_starts_empty(tmp_path):
+    """A cache with no file on disk starts empty and creates the log on persist."""
+    path = tmp_path / "cache.log"
+    cache = JobCache(path)
+    assert cache.seen == set()
+
+    cache.add("aaaa")
+    cache.persist()
+    assert path.read_text() == "aaaa\n"
+
+
+def test_job_cache_round_trips_newline_log(tmp_path):
+    """Hashes persisted as a newline log load back unchanged."""
+    path = tmp_path / "cache.log"
+    cache = JobCache(path)
+    for job_hash in ("aaaa", "bbbb", "cccc"):
+        cache.add(job_hash)
+    cache.persist()
+
+    reloaded = JobCache(path)
+    assert reloaded.seen == {"aaaa", "bbbb", "cccc"}
+    assert all(reloaded.contains(h) for h in ("aaaa", "bbbb", "cccc"))
+
+
+def test_job_cache_appends_only_new_hashes(tmp_path):
+    """persist appends just the hashes added since the last flush."""
+    path = tmp_path / "cache.log"
+    path.write_text("aaaa\nbbbb\n")
+
+    cache = JobCache(path)
+    cache.add("bbbb")  # already known, must not be written again
+    cache.add("cccc")
+    cache.persist()
+    assert path.read_text() == "aaaa\nbbbb\ncccc\n"
+
+    # Nothing new: the file is left untouched
+    cache.persist()
+    assert path.read_text() == "aaaa\nbbbb\ncccc\n"
+
+
+def test_job_cache_rewrites_legacy_json_list_once(tmp_path):
+    """A legacy JSON-list cache is read, then rewritten as a log on the first flush."""
+    path = tmp_path / "cache.json"
+    path.write_text(json.dumps(["aaaa", "bbbb"]))
+
+    cache = JobCache(path)
+    assert cache.seen == {"aaaa", "bbbb"}
+
+    cache.add("cccc")
+    cache.persist()
+    assert sorted(path.read_text().splitlines()) == ["aaaa", "bbbb", "cccc"]
+
+    # Later flushes append instead of rewriting
+    cache.add("dddd")
+    cache.persist()
+    lines = path.read_text().splitlines()
+    assert lines[-1] == "dddd"
+    assert sorted(lines) == ["aaaa", "bbbb", "cccc", "dddd"]
+    assert JobCache(path).seen == {"aaaa", "bbbb", "cccc", "dddd"}
+
+
+def test_job_cache_ignores_corrupt_legacy_file(tmp_path):
+    """An unreadable legacy JSON cache is treated as empty."""
+    path = tmp_path / "cache.json"
+    path.write_text("[not json")
+    assert JobCache(path).seen == set()
+
+
+def test_pipeline_treats_legacy_sha256_entries_as_seen(tmp_path, monkeypatch):
+    """Jobs cached under the old SHA-256 key are not re-notified, and get re-keyed."""
+    company, url = "Acme", "https://acme.com/careers/dev"
+    legacy_hash = hashlib.sha256(f"{company}{url}".encode("utf-8")).hexdigest()
+    path = tmp_path / "cache.json"
+    path.write_text(json.dumps([legacy_hash]))
+    monkeypatch.setattr(pipelines, "JOB_CACHE_PATH", path)
+    spider = SimpleNamespace(logger=logging.getLogger("test_pipelines"))
+
+    pipeline = NtfyNotifyPipeline()
+    with pytest.raises(DropItem):
+        pipeline.process_item({"company": company, "job_page": url, "role": "developer"}, spider)
+
+    # No new jobs to notify, but the migrated key is still written out
+    pipeline.close_spider(spider)
+    new_hash = NtfyNotifyPipeline._hash_job(company, url)
+    assert path.read_text().splitlines() == [new_hash]
+
+    # The next crawl recognises the job by its new key alone
+    rerun = NtfyNotifyPipeline()
+    assert rerun.cache.legacy == set()
+    with pytest.raises(DropItem):
+        rerun.process_item({"company": company, "job_page": url, "role": "developer"}, spider)
+
+
+def test_job_cache_keeps_unmatched_legacy_entries(tmp_path):
+    """Legacy keys that haven't been re-keyed yet survive a rewrite."""
+    legacy = "f" * JobCache.LEGACY_HASH_LEN
+    other = "e" * JobCache.LEGACY_HASH_LEN
+    path = tmp_path / "cache.log"
+    path.write_text(f"{legacy}\n{other}\n")
+
+    cache = JobCache(path)
+    assert cache.legacy == {legacy, other}
+    assert cache.migrate(legacy, "0123456789abcdef")
+    assert not cache.migrate("missing", "fedcba9876543210")
+    cache.persist()
+
+    reloaded = JobCache(path)
+    assert reloaded.seen == {"0123456789abcdef"}
+    assert reloaded.legacy == {other}
+
+
+def test_job_cache_failed_rewrite_keeps_old_cache(tmp_path, monkeypatch):
+    """A rewrite that fails leaves the cache on disk intact and is retried on the next flush."""
+    path = tmp_path / "cache.json"
+    path.write_text(json.dumps(["aaaa", "bbbb"]))
+    cache = JobCache(path)
+    cache.add("cccc")
+
+    def fail_replace(self, target):
+        raise OSError("disk full")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(type(path), "replace", fail_replace)
+        cache.persist()
+    assert json.loads(path.read_text()) == ["aaaa", "bbbb"]
+
+    cache.persist()
+    assert sorted(path.read_text().splitlines()) == ["aaaa", "bbbb", "cccc"]
+    assert not (tmp_path / "cache.json.tmp").exists()
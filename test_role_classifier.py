@@ -3,6 +3,8 @@ Tests for role classification and scoring engine.
 """
 
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+
 from role_classifier import RoleClassifier
 
 
@@ -208,6 +210,71 @@ class TestRoleFilters(unittest.TestCase):
         # Clean up
         os.environ.pop('REMOTE_ONLY', None)
 
+    def test_keyword_hits_match_substring_scan(self):
+        """The keyword hit mask agrees with a plain substring check for every keyword."""
+        from role_classifier import _KEYWORDS, _KEYWORD_BITS, _keyword_hits
+
+        samples = [
+            "",
+            "nodejs hubspot engineering",
+            "we are a hubspotpartner with serverless functions",
+            "independent contractor wanted for remote-friendly freelance work",
+            "senior specialist in revops architecture and crm migrations",
+        ]
+        for content in samples:
+            hits = _keyword_hits(content)
+            for keyword in _KEYWORDS:
+                self.assertEqual(
+                    bool(hits & _KEYWORD_BITS[keyword]), keyword in content,
+                    f"{keyword!r} in {content!r}",
+                )
+
+    def test_repeated_page_reuses_keyword_hits(self):
+        """Classifying the same text again reuses its cached keyword hits."""
+        content = "hubspot cms hub developer, api integrations, remote"
+
+        first = self.classifier.classify_and_score(content, {})
+        self.assertEqual(len(self.classifier._hits_cache), 1)
+        self.assertEqual(self.classifier.classify_and_score(content, {}), first)
+        self.assertEqual(len(self.classifier._hits_cache), 1)
+
+    def test_page_without_tech_keywords_skips_scan(self):
+        """A page with no HubSpot tech keyword is rejected without a full scan."""
+        content = "senior consultant, remote, independent contractor"
+        self.assertIsNone(self.classifier.classify_and_score(content, {}))
+        self.assertEqual(list(self.classifier._hits_cache.values()), [0])
+
+    def test_allow_agencies_read_when_classifier_is_created(self):
+        """ALLOW_AGENCIES is fixed per classifier, like the other filters."""
+        import os
+        content = "hubspot cms hub developer, api integrations, staffing agency, remote"
+
+        os.environ['ALLOW_AGENCIES'] = 'true'
+        try:
+            allowing = RoleClassifier()
+        finally:
+            os.environ.pop('ALLOW_AGENCIES', None)
+
+        self.assertIsNotNone(allowing.classify_and_score(content, {}))
+        self.assertIsNone(self.classifier.classify_and_score(content, {}))
+
+    def test_hits_cache_is_bounded(self):
+        """The per-page hit cache evicts the oldest entries beyond its size."""
+        for n in range(RoleClassifier.HITS_CACHE_SIZE + 5):
+            self.classifier.classify_and_score(f"page {n} hubspot developer", {})
+        self.assertEqual(len(self.classifier._hits_cache), RoleClassifier.HITS_CACHE_SIZE)
+
+    def test_hits_cache_shared_between_threads(self):
+        """Pages classified from several threads at once evict without errors."""
+        def classify(worker):
+            for n in range(RoleClassifier.HITS_CACHE_SIZE * 4):
+                self.classifier.classify_and_score(f"page {worker}-{n} hubspot developer", {})
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            for future in [pool.submit(classify, worker) for worker in range(4)]:
+                future.result()
+        self.assertEqual(len(self.classifier._hits_cache), RoleClassifier.HITS_CACHE_SIZE)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,229 @@
+"""
+Tests for the in-memory state module.
+
+Covers the EventBus delivery guarantees relied on by the SSE endpoints and
+the CrawlerState job/domain lookups.
+"""
+
+import asyncio
+import threading
+from datetime import datetime
+
+from models import DomainItem, JobItem
+from state import CrawlerState, EventBus, put_drop_oldest
+
+
+def make_job(job_id, domain="acme.com", title="Engineer"):
+    """Build a minimal JobItem for state tests."""
+    return JobItem(
+        id=job_id,
+        domain=domain,
+        title=title,
+        url=f"https://{domain}/jobs/{job_id}",
+        source_page=f"https://{domain}/careers",
+        created_at=datetime(2024, 1, 1),
+    )
+
+
+def test_event_bus_delivers_published_events():
+    """Events published on the loop reach every subscriber."""
+    async def scenario():
+        bus = EventBus()
+        first = bus.subscribe()
+        second = bus.subscribe()
+        await bus.publish("hello")
+        assert await asyncio.wait_for(first.get(), 1) == "hello"
+        assert await asyncio.wait_for(second.get(), 1) == "hello"
+
+    asyncio.run(scenario())
+
+
+def test_event_bus_publish_from_worker_thread():
+    """publish_nowait from a worker thread is handed to the subscribers' loop."""
+    async def scenario():
+        bus = EventBus()
+        queue = bus.subscribe()
+        await asyncio.to_thread(bus.publish_nowait, "from-thread")
+        assert await asyncio.wait_for(queue.get(), 1) == "from-thread"
+
+    asyncio.run(scenario())
+
+
+def test_event_bus_publish_without_loop_is_dropped():
+    """With no loop to deliver to, publishing is a silent no-op."""
+    bus = EventBus()
+    bus.subscribe()  # subscribed outside any loop
+    errors = []
+
+    def publish():
+        try:
+            bus.publish_nowait("nowhere")
+        except Exception as e:  # pragma: no cover - failure path
+            errors.append(e)
+
+    worker = threading.Thread(target=publish)
+    worker.start()
+    worker.join()
+    assert errors == []
+
+
+def test_event_bus_leaves_no_pending_tasks():
+    """Publishing must not leave a background task running on the loop."""
+    async def scenario():
+        bus = EventBus()
+        queue = bus.subscribe()
+        bus.publish_nowait("event")
+        await asyncio.wait_for(queue.get(), 1)
+        return asyncio.all_tasks() - {asyncio.current_task()}
+
+    assert asyncio.run(scenario()) == set()
+
+
+def test_event_bus_follows_a_new_loop():
+    """A bus reused across event loops keeps delivering on the new loop."""
+    bus = EventBus()
+
+    async def scenario(payload):
+        queue = bus.subscribe()
+        try:
+            bus.publish_nowait(payload)
+            return await asyncio.wait_for(queue.get(), 1)
+        finally:
+            bus.unsubscribe(queue)
+
+    assert asyncio.run(scenario("first")) == "first"
+    assert asyncio.run(scenario("second")) == "second"
+
+
+def test_event_bus_unsubscribe():
+    """Unsubscribed queues stop receiving events; repeat unsubscribes are no-ops."""
+    async def scenario():
+        bus = EventBus()
+        kept = bus.subscribe()
+        dropped = bus.subscribe()
+        bus.unsubscribe(dropped)
+        bus.unsubscribe(dropped)
+        await bus.publish("after")
+        assert await asyncio.wait_for(kept.get(), 1) == "after"
+        assert dropped.empty()
+
+    asyncio.run(scenario())
+
+
+def test_put_drop_oldest_discards_oldest_item():
+    """A full queue loses its oldest item to make room for the new one."""
+    queue = asyncio.Queue(maxsize=2)
+    for item in ("a", "b", "c"):
+        put_drop_oldest(queue, item)
+    assert [queue.get_nowait(), queue.get_nowait()] == ["b", "c"]
+
+
+def test_event_bus_slow_subscriber_keeps_newest_events():
+    """A subscriber that falls behind keeps the newest events, not the oldest."""
+    async def scenario():
+        bus = EventBus()
+        slow = bus.subscribe(maxsize=2)
+        for n in range(5):
+            bus.publish_nowait(n)
+        await asyncio.sleep(0)
+        return [slow.get_nowait() for _ in range(slow.qsize())]
+
+    assert asyncio.run(scenario()) == [3, 4]
+
+
+def test_crawler_state_get_job_and_query_by_domain():
+    """Jobs added through add_job are found by id and by domain."""
+    state = CrawlerState()
+    state.add_job(make_job("1", "acme.com"))
+    state.add_job(make_job("2", "globex.com"))
+    state.add_job(make_job("3", "acme.com"))
+
+    assert state.get_job("2").domain == "globex.com"
+    assert state.get_job("missing") is None
+    assert [job.id for job in state.query_jobs(domain="acme.com")] == ["1", "3"]
+    assert state.query_jobs(domain="initech.com") == []
+
+
+def test_crawler_state_add_domain_moves_updated_domain_last():
+    """Updating a domain replaces it and lists it as the most recently updated."""
+    state = CrawlerState()
+    for name in ("a.com", "b.com", "c.com"):
+        state.add_domain(DomainItem(domain=name))
+    state.add_domain(DomainItem(domain="a.com", status="done"))
+
+    assert [d.domain for d in state.list_domains()] == ["b.com", "c.com", "a.com"]
+    assert state.get_domain("a.com").status == "done"
+    assert state.get_domain("b.com").domain == "b.com"
+    assert state.get_domain("missing") is None
+
+    # Updating the last domain keeps it in place
+    state.add_domain(DomainItem(domain="a.com", status="again"))
+    assert [d.domain for d in state.list_domains()] == ["b.com", "c.com", "a.com"]
+    assert state.get_domain("a.com").status == "again"
+
+
+def test_crawler_state_lists_reassigned_directly():
+    """Lookups follow lists that are reassigned rather than built through add_*."""
+    state = CrawlerState()
+    state.add_job(make_job("old"))
+    state.add_domain(DomainItem(domain="old.com"))
+
+    state._jobs = [make_job("1", "acme.com"), make_job("2", "globex.com")]
+    state._domains = [DomainItem(domain="a.com"), DomainItem(domain="b.com")]
+
+    assert state.get_job("old") is None
+    assert state.get_job("2").domain == "globex.com"
+    assert [job.id for job in state.query_jobs(domain="acme.com")] == ["1"]
+    assert state.get_domain("old.com") is None
+    assert state.get_domain("b.com").domain == "b.com"
+
+    state.add_job(make_job("3", "acme.com"))
+    assert [job.id for job in state.query_jobs(domain="acme.com")] == ["1", "3"]
+
+
+def test_crawler_state_elements_replaced_in_place():
+    """Replacing a list element without changing the length does not leave stale hits."""
+    state = CrawlerState()
+    state.add_job(make_job("1", "acme.com"))
+    state.add_job(make_job("2", "acme.com"))
+    state.add_domain(DomainItem(domain="a.com"))
+    state.add_domain(DomainItem(domain="b.com"))
+    assert state.get_job("1") is not None
+    assert state.get_domain("a.com") is not None
+
+    state._jobs[0] = make_job("9", "globex.com")
+    state._domains[0] = DomainItem(domain="z.com")
+
+    assert state.get_job("1") is None
+    assert state.get_job("9").domain == "globex.com"
+    assert [job.id for job in state.query_jobs(domain="acme.com")] == ["2"]
+    assert [job.id for job in state.query_jobs(domain="globex.com")] == ["9"]
+    assert state.get_domain("a.com") is None
+    assert state.get_domain("z.com").domain == "z.com"
+
+
+def test_crawler_state_misses_do_not_rebuild_indexes(monkeypatch):
+    """New domains and unknown ids are answered from a current index, without a rebuild."""
+    state = CrawlerState()
+    state.add_job(make_job("1", "acme.com"))
+    calls = {"jobs": 0, "domains": 0}
+    reindex_jobs, reindex_domains = state._reindex_jobs, state._reindex_domains
+
+    def count_jobs():
+        calls["jobs"] += 1
+        reindex_jobs()
+
+    def count_domains():
+        calls["domains"] += 1
+        reindex_domains()
+
+    monkeypatch.setattr(state, "_reindex_jobs", count_jobs)
+    monkeypatch.setattr(state, "_reindex_domains", count_domains)
+
+    for n in range(100):
+        state.add_domain(DomainItem(domain=f"d{n}.com"))
+        assert state.get_job(f"missing-{n}") is None
+        assert state.query_jobs(domain=f"d{n}.com") == []
+        assert state.get_domain(f"missing-{n}.com") is None
+    assert state.get_job("1").domain == "acme.com"
+    assert calls == {"jobs": 0, "domains": 0}
@@ -0,0 +1,102 @@
+"""
+Tests for saving a domain's jobs to Supabase.
+
+Covers the single bulk insert per domain and the row-by-row fallback when
+Supabase rejects the batch.
+"""
+
+from types import SimpleNamespace
+
+import supabase_persistence
+from supabase_persistence import save_jobs_for_domain
+
+
+class FakeTable:
+    """Records inserts; rejects list inserts when told to and rows titled "bad"."""
+
+    def __init__(self, client, name):
+        self.client = client
+        self.name = name
+        self.payload = None
+
+    def insert(self, payload):
+        self.payload = payload
+        return self
+
+    def execute(self):
+        self.client.requests.append((self.name, self.payload))
+        rows = self.payload if isinstance(self.payload, list) else [self.payload]
+        if isinstance(self.payload, list) and self.name in self.client.reject_bulk:
+            raise RuntimeError("bulk insert rejected")
+        if any(row.get("job_title") == "bad" for row in rows):
+            raise RuntimeError("bad row")
+        data = []
+        for row in rows:
+            self.client.next_id += 1
+            data.append({**row, "id": f"id-{self.client.next_id}"})
+        return SimpleNamespace(data=data)
+
+
+class FakeClient:
+    """Supabase client stand-in logging (table, payload) for every request."""
+
+    def __init__(self, reject_bulk=()):
+        self.requests = []
+        self.reject_bulk = set(reject_bulk)
+        self.next_id = 0
+
+    def table(self, name):
+        return FakeTable(self, name)
+
+
+def make_jobs():
+    """Build three jobs; the second is one Supabase rejects."""
+    return [
+        {"title": "HubSpot Developer", "url": "https://acme.com/jobs/1", "seniority": "senior"},
+        {"title": "bad", "url": "https://acme.com/jobs/2"},
+        {"title": "RevOps Manager", "url": "https://acme.com/jobs/3"},
+    ]
+
+
+def test_jobs_saved_in_one_request(monkeypatch):
+    """A domain's jobs, and then their metadata, each go in a single insert."""
+    client = FakeClient()
+    monkeypatch.setattr(supabase_persistence, "get_supabase_client", lambda: client)
+    jobs = [job for job in make_jobs() if job["title"] != "bad"]
+
+    save_jobs_for_domain("run-1", "company-1", jobs)
+
+    assert [name for name, _ in client.requests] == ["jobs", "job_metadata"]
+    rows = client.requests[0][1]
+    assert [row["job_title"] for row in rows] == ["HubSpot Developer", "RevOps Manager"]
+    assert all(row["run_id"] == "run-1" and row["company_id"] == "company-1" for row in rows)
+    assert client.requests[1][1] == [{
+        "job_id": "id-1",
+        "seniority": "senior",
+        "employment_type": None,
+        "salary_min": None,
+        "salary_max": None,
+        "technologies": None,
+        "raw_json": None,
+    }]
+
+
+def test_rejected_batch_falls_back_to_single_inserts(monkeypatch):
+    """When the bulk insert fails, every other job is still saved on its own."""
+    client = FakeClient(reject_bulk={"jobs"})
+    monkeypatch.setattr(supabase_persistence, "get_supabase_client", lambda: client)
+
+    save_jobs_for_domain("run-1", "company-1", make_jobs())
+
+    single_inserts = [payload for name, payload in client.requests[1:] if name == "jobs"]
+    assert [row["job_title"] for row in single_inserts] == ["HubSpot Developer", "bad", "RevOps Manager"]
+    metadata = [payload for name, payload in client.requests if name == "job_metadata"]
+    assert metadata == [{
+        "job_id": "id-1",
+        "seniority": "senior",
+        "employment_type": None,
+        "salary_min": None,
+        "salary_max": None,
+        "technologies": None,
+        "raw_json": None,
+    }]